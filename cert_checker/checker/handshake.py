@@ -0,0 +1,191 @@
+"""Minimal TLS handshake reader for fetching server certificates.
+
+Sends a TLS 1.2 ClientHello and reads the server's plaintext Certificate
+message, then drops the connection without completing key exchange.
+TLS 1.3 encrypts the Certificate message, so only TLS 1.2 (and older)
+handshakes can be read this way.
+"""
+
+import ipaddress
+import os
+import socket
+import ssl
+import struct
+from typing import Iterable, List, Optional
+
+# TLS record content types
+_RECORD_ALERT = 21
+_RECORD_HANDSHAKE = 22
+
+# Handshake message types
+_CLIENT_HELLO = 1
+_CERTIFICATE = 11
+_SERVER_HELLO_DONE = 14
+
+# Extension types
+_EXT_SERVER_NAME = 0x0000
+_EXT_SUPPORTED_GROUPS = 0x000A
+_EXT_EC_POINT_FORMATS = 0x000B
+_EXT_SIGNATURE_ALGORITHMS = 0x000D
+
+# Largest record fragment allowed by RFC 5246 (2^14 + 2048)
+_MAX_RECORD_LENGTH = 18432
+
+_CIPHER_SUITES = (
+    0xC02B,  # ECDHE-ECDSA-AES128-GCM-SHA256
+    0xC02F,  # ECDHE-RSA-AES128-GCM-SHA256
+    0xC02C,  # ECDHE-ECDSA-AES256-GCM-SHA384
+    0xC030,  # ECDHE-RSA-AES256-GCM-SHA384
+    0xCCA9,  # ECDHE-ECDSA-CHACHA20-POLY1305
+    0xCCA8,  # ECDHE-RSA-CHACHA20-POLY1305
+    0xC013,  # ECDHE-RSA-AES128-SHA
+    0xC014,  # ECDHE-RSA-AES256-SHA
+    0x009C,  # RSA-AES128-GCM-SHA256
+    0x009D,  # RSA-AES256-GCM-SHA384
+    0x002F,  # RSA-AES128-SHA
+    0x0035,  # RSA-AES256-SHA
+)
+
+_SUPPORTED_GROUPS = (
+    0x001D,  # x25519
+    0x0017,  # secp256r1
+    0x0018,  # secp384r1
+)
+
+_SIGNATURE_ALGORITHMS = (
+    0x0403,  # ecdsa_secp256r1_sha256
+    0x0804,  # rsa_pss_rsae_sha256
+    0x0401,  # rsa_pkcs1_sha256
+    0x0503,  # ecdsa_secp384r1_sha384
+    0x0805,  # rsa_pss_rsae_sha384
+    0x0501,  # rsa_pkcs1_sha384
+    0x0806,  # rsa_pss_rsae_sha512
+    0x0601,  # rsa_pkcs1_sha512
+    0x0201,  # rsa_pkcs1_sha1
+)
+
+
+def _u16_list(values: Iterable[int]) -> bytes:
+    """Encode a length-prefixed list of 16-bit values."""
+    body = b"".join(struct.pack("!H", value) for value in values)
+    return struct.pack("!H", len(body)) + body
+
+
+def _extension(ext_type: int, data: bytes) -> bytes:
+    """Encode a ClientHello extension."""
+    return struct.pack("!HH", ext_type, len(data)) + data
+
+
+def _is_ip_address(host: str) -> bool:
+    """Check if host is an IP address literal (not valid for SNI)."""
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+def build_client_hello(server_name: Optional[str] = None) -> bytes:
+    """
+    Build a TLS 1.2 ClientHello record.
+
+    Args:
+        server_name: Hostname to send as SNI (omitted for IP addresses)
+
+    Returns:
+        Encoded TLS record
+    """
+    extensions = [
+        _extension(_EXT_SUPPORTED_GROUPS, _u16_list(_SUPPORTED_GROUPS)),
+        _extension(_EXT_EC_POINT_FORMATS, b"\x01\x00"),
+        _extension(_EXT_SIGNATURE_ALGORITHMS, _u16_list(_SIGNATURE_ALGORITHMS)),
+    ]
+    if server_name and not _is_ip_address(server_name):
+        name = server_name.encode("idna")
+        entry = b"\x00" + struct.pack("!H", len(name)) + name
+        extensions.insert(0, _extension(_EXT_SERVER_NAME, struct.pack("!H", len(entry)) + entry))
+
+    ext_data = b"".join(extensions)
+    body = (
+        b"\x03\x03"  # TLS 1.2
+        + os.urandom(32)
+        + b"\x00"  # empty session id
+        + _u16_list(_CIPHER_SUITES)
+        + b"\x01\x00"  # null compression only
+        + struct.pack("!H", len(ext_data))
+        + ext_data
+    )
+    handshake = bytes([_CLIENT_HELLO]) + len(body).to_bytes(3, "big") + body
+    return struct.pack("!BHH", _RECORD_HANDSHAKE, 0x0301, len(handshake)) + handshake
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from socket."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed during TLS handshake")
+        data += chunk
+    return bytes(data)
+
+
+def _parse_certificate_message(body: bytes) -> List[bytes]:
+    """Split a Certificate handshake message into DER certificates."""
+    end = min(3 + int.from_bytes(body[0:3], "big"), len(body))
+    certs = []
+    pos = 3
+    while pos + 3 <= end:
+        cert_len = int.from_bytes(body[pos : pos + 3], "big")
+        pos += 3
+        certs.append(body[pos : pos + cert_len])
+        pos += cert_len
+    return certs
+
+
+def fetch_certificate_chain_der(sock: socket.socket, server_name: Optional[str]) -> List[bytes]:
+    """
+    Fetch the server certificate chain without completing the handshake.
+
+    Args:
+        sock: Connected TCP socket
+        server_name: Hostname for SNI
+
+    Returns:
+        List of DER-encoded certificates (leaf first)
+
+    Raises:
+        ssl.SSLError: Server sent an alert or an unexpected record
+        ConnectionError: Server closed the connection
+    """
+    sock.sendall(build_client_hello(server_name))
+
+    buffer = b""
+    while True:
+        content_type, _, length = struct.unpack("!BHH", _recv_exact(sock, 5))
+        if length > _MAX_RECORD_LENGTH:
+            raise ssl.SSLError(f"TLS record too large: {length} bytes")
+        fragment = _recv_exact(sock, length)
+
+        if content_type == _RECORD_ALERT:
+            description = fragment[1] if len(fragment) > 1 else "unknown"
+            raise ssl.SSLError(f"TLS alert received: {description}")
+        if content_type != _RECORD_HANDSHAKE:
+            raise ssl.SSLError(f"Unexpected TLS record type: {content_type}")
+
+        # Handshake messages may span several records
+        buffer += fragment
+        while len(buffer) >= 4:
+            msg_type = buffer[0]
+            msg_len = int.from_bytes(buffer[1:4], "big")
+            if len(buffer) < 4 + msg_len:
+                break
+
+            body = buffer[4 : 4 + msg_len]
+            buffer = buffer[4 + msg_len :]
+
+            if msg_type == _CERTIFICATE:
+                return _parse_certificate_message(body)
+            if msg_type == _SERVER_HELLO_DONE:
+                # Anonymous key exchange: no certificate sent
+                return []
@@ -1,29 +1,38 @@
 """Remote SSL/TLS certificate checker."""
 
+import functools
 import socket
 import ssl
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from enum import Enum
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from functools import cached_property
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 from cryptography import x509
 
+from cert_checker.checker.handshake import fetch_certificate_chain_der
 from cert_checker.config import Config, HostConfig
-from cert_checker.utils.cert_parser import CertificateParser
+from cert_checker.utils.cert_parser import CertificateParser, CertificateSummary
 
 
-class CertificateStatus(Enum):
-    """Certificate status enumeration."""
+class CertificateStatus(IntEnum):
+    """Certificate status enumeration (ordered by severity)."""
 
-    VALID = "valid"
-    WARNING = "warning"
-    EXPIRED = "expired"
-    ERROR = "error"
+    VALID = 0
+    WARNING = 1
+    EXPIRED = 2
+    ERROR = 3
 
+    @property
+    def label(self) -> str:
+        """Lowercase status name used in output."""
+        return self.name.lower()
 
-@dataclass
-class ExpirationInfo:
+
+class ExpirationInfo(NamedTuple):
     """Certificate expiration information."""
 
     not_before: datetime
@@ -48,16 +57,227 @@ class HostCheckResult:
     hostname_valid: Optional[bool] = None
     error: Optional[str] = None
 
+    # Display strings, formatted once per result
+
+    @cached_property
+    def address(self) -> str:
+        """Host address as fqdn:port."""
+        return f"{self.fqdn}:{self.port}"
+
+    @cached_property
+    def expiry_date(self) -> Optional[str]:
+        """Expiration date as YYYY-MM-DD (None without expiration info)."""
+        if self.expiration is None:
+            return None
+        return self.expiration.not_after.strftime("%Y-%m-%d")
+
+    @cached_property
+    def days_text(self) -> Optional[str]:
+        """Days remaining, negative once expired (None without expiration info)."""
+        if self.expiration is None:
+            return None
+        # days_remaining is floored, so it is already negative once expired
+        return str(self.expiration.days_remaining)
+
+
+@dataclass
+class HostCheckResultBatch:
+    """Column-oriented view of many host check results."""
+
+    host_names: List[str] = field(default_factory=list)
+    fqdns: List[str] = field(default_factory=list)
+    ports: List[int] = field(default_factory=list)
+    statuses: List[CertificateStatus] = field(default_factory=list)
+    days_remaining: List[Optional[int]] = field(default_factory=list)
+    not_after_ts: List[Optional[int]] = field(default_factory=list)
+
+    @classmethod
+    def from_results(cls, results: List[HostCheckResult]) -> "HostCheckResultBatch":
+        """Build batch from per-host results."""
+        batch = cls()
+        for result in results:
+            batch.append(result)
+        return batch
+
+    def __len__(self) -> int:
+        """Number of results in batch."""
+        return len(self.fqdns)
+
+    def append(self, result: HostCheckResult) -> None:
+        """Append a single host result."""
+        self.host_names.append(result.host_name)
+        self.fqdns.append(result.fqdn)
+        self.ports.append(result.port)
+        self.statuses.append(result.status)
+        if result.expiration:
+            self.days_remaining.append(result.expiration.days_remaining)
+            self.not_after_ts.append(int(result.expiration.not_after.timestamp()))
+        else:
+            self.days_remaining.append(None)
+            self.not_after_ts.append(None)
+
+    def expiring_within(self, days: int) -> List[int]:
+        """
+        Get indices of results expiring in fewer than the given days.
+
+        Args:
+            days: Days threshold
+
+        Returns:
+            Indices into the batch columns (errors are excluded)
+        """
+        return [
+            i
+            for i, remaining in enumerate(self.days_remaining)
+            if remaining is not None and remaining < days
+        ]
+
+
+# Upper bound on concurrent TLS handshakes in check_all_hosts
+MAX_WORKERS = 64
+
+SECONDS_PER_DAY = 86400
+
+# Seconds a TLS session is reused for repeated probes of the same host.
+# Off by default: a resumed session reports the certificate of the original
+# handshake, so a rotated certificate would not be seen until it expires.
+SESSION_TTL = 0
+
+# Seconds a DNS resolution is reused
+DNS_TTL = 60
+
+# DER encoding for _ssl.Certificate.public_bytes (Python 3.10+)
+_ENCODING_DER = getattr(ssl._ssl, "ENCODING_DER", None)  # type: ignore[attr-defined]
+
+
+def _get_peer_chain_der(ssock: ssl.SSLSocket) -> List[bytes]:
+    """Get DER-encoded certificates sent by the peer (leaf first)."""
+    get_chain = getattr(getattr(ssock, "_sslobj", None), "get_unverified_chain", None)
+    if get_chain is not None and _ENCODING_DER is not None:
+        chain = get_chain()
+        if chain:
+            return [cert.public_bytes(_ENCODING_DER) for cert in chain]
+
+    # Older Python versions only expose the leaf certificate
+    der_cert = ssock.getpeercert(binary_form=True)
+    return [der_cert] if der_cert else []
+
+
+@functools.lru_cache(maxsize=1024)
+def _san_index(cert: x509.Certificate) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Split certificate SAN DNS names into exact names and wildcard patterns (lowercase)."""
+    san_list = CertificateParser.get_san(cert)
+    exact = frozenset(san.lower() for san in san_list if "*" not in san)
+    wildcards = tuple(san.lower() for san in san_list if "*" in san)
+    return exact, wildcards
+
 
 class RemoteCertChecker:
     """Remote certificate checker."""
 
-    def __init__(self, timeout: int = 10):
-        """Initialize checker with timeout."""
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_workers: int = MAX_WORKERS,
+        session_ttl: int = SESSION_TTL,
+        dns_ttl: int = DNS_TTL,
+    ):
+        """
+        Initialize checker.
+
+        Args:
+            timeout: Default connection timeout
+            max_workers: Maximum concurrent checks in check_all_hosts
+            session_ttl: Seconds to reuse TLS sessions per host (0, the default, disables)
+            dns_ttl: Seconds to reuse DNS resolutions per host (0 disables)
+        """
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.session_ttl = session_ttl
+        self.dns_ttl = dns_ttl
+
+        # SSL context is shared by all connections (wrap_socket is thread-safe).
+        # Don't verify certificate (we want to get it even if invalid)
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        # TLS sessions for resumption: (fqdn, port) -> (created, session)
+        self._sessions: Dict[Tuple[str, int], Tuple[float, ssl.SSLSession]] = {}
+
+        # DNS resolutions: (fqdn, port) -> (resolved, getaddrinfo results)
+        self._dns_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple]]] = {}
+
+    def resolve(self, fqdn: str, port: int = 443) -> List[Tuple]:
+        """
+        Resolve host addresses, reusing recent results.
+
+        Args:
+            fqdn: Fully qualified domain name
+            port: Port number
+
+        Returns:
+            getaddrinfo results for TCP connections
+
+        Raises:
+            socket.gaierror: DNS resolution failed
+        """
+        key = (fqdn, port)
+        now = time.monotonic()
+        cached = self._dns_cache.get(key)
+        if cached and now - cached[0] < self.dns_ttl:
+            return cached[1]
+
+        addresses = socket.getaddrinfo(fqdn, port, type=socket.SOCK_STREAM)
+        if self.dns_ttl:
+            self._dns_cache[key] = (now, addresses)
+        return addresses
+
+    def _try_resolve(self, fqdn: str, port: int) -> None:
+        """Warm the DNS cache for host, ignoring resolution errors."""
+        try:
+            self.resolve(fqdn, port)
+        except OSError:
+            pass
+
+    def _connect(self, fqdn: str, port: int, timeout: float) -> socket.socket:
+        """Open TCP connection to host using cached DNS resolution."""
+        last_error: Optional[OSError] = None
+        for _, _, _, _, sockaddr in self.resolve(fqdn, port):
+            try:
+                return socket.create_connection(sockaddr[:2], timeout=timeout)
+            except OSError as e:
+                last_error = e
+
+        raise last_error or OSError(f"No addresses found for {fqdn}")
+
+    @functools.cached_property
+    def _verify_context(self) -> ssl.SSLContext:
+        """SSL context that verifies chain and hostname (built on first use)."""
+        return ssl.create_default_context()
+
+    def _get_session(self, fqdn: str, port: int) -> Optional[ssl.SSLSession]:
+        """Get a cached TLS session for host if still fresh."""
+        if not self.session_ttl:
+            return None
+
+        cached = self._sessions.get((fqdn, port))
+        if cached and time.monotonic() - cached[0] < self.session_ttl:
+            return cached[1]
+        return None
+
+    def _store_session(self, fqdn: str, port: int, ssock: ssl.SSLSocket) -> None:
+        """Remember the TLS session of a fresh (non-resumed) handshake."""
+        if self.session_ttl and ssock.session is not None and not ssock.session_reused:
+            self._sessions[(fqdn, port)] = (time.monotonic(), ssock.session)
 
     def get_certificate_chain(
-        self, fqdn: str, port: int = 443, timeout: Optional[int] = None
+        self,
+        fqdn: str,
+        port: int = 443,
+        timeout: Optional[int] = None,
+        fast_fetch: bool = False,
+        verify: bool = False,
     ) -> List[x509.Certificate]:
         """
         Get certificate chain from remote host.
@@ -66,6 +286,10 @@ class RemoteCertChecker:
             fqdn: Fully qualified domain name
             port: Port number
             timeout: Connection timeout (uses default if not provided)
+            fast_fetch: Read the certificate from the handshake without completing it,
+                falling back to a full handshake if the server refuses TLS 1.2
+            verify: Let OpenSSL verify chain and hostname during the handshake
+                (fast_fetch is ignored)
 
         Returns:
             List of certificates in chain (leaf first)
@@ -73,31 +297,73 @@ class RemoteCertChecker:
         Raises:
             socket.timeout: Connection timeout
             socket.error: Connection error
+            ssl.SSLCertVerificationError: Verification failed (verify mode)
             ssl.SSLError: SSL/TLS error
         """
         timeout = timeout or self.timeout
-
-        # Create SSL context
-        context = ssl.create_default_context()
-        # Don't verify certificate (we want to get it even if invalid)
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
+        der_cert_chain = self._fetch_chain_der(fqdn, port, timeout, fast_fetch, verify)
+
+        # Parse certificates
+        return [CertificateParser.parse_der(der_cert) for der_cert in der_cert_chain]
+
+    def _fetch_chain_der(
+        self, fqdn: str, port: int, timeout: float, fast_fetch: bool, verify: bool
+    ) -> List[bytes]:
+        """Fetch DER-encoded certificate chain (see get_certificate_chain)."""
+        if verify:
+            with self._connect(fqdn, port, timeout) as sock:
+                with self._verify_context.wrap_socket(sock, server_hostname=fqdn) as ssock:
+                    return _get_peer_chain_der(ssock)
+
+        if fast_fetch:
+            try:
+                with self._connect(fqdn, port, timeout) as sock:
+                    return fetch_certificate_chain_der(sock, fqdn)
+            except OSError:
+                # Includes SSLError and a server stalling on the hand-built ClientHello
+                pass
 
         # Connect and get certificate chain
-        with socket.create_connection((fqdn, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=fqdn) as ssock:
+        with self._connect(fqdn, port, timeout) as sock:
+            with self._ssl_context.wrap_socket(
+                sock, server_hostname=fqdn, session=self._get_session(fqdn, port)
+            ) as ssock:
                 # Get DER-encoded certificate chain
-                der_cert_chain = ssock.getpeercert(binary_form=True)
+                der_cert_chain = _get_peer_chain_der(ssock)
+                self._store_session(fqdn, port, ssock)
+                return der_cert_chain
 
-                # Parse certificate
-                if der_cert_chain:
-                    cert = CertificateParser.parse_der(der_cert_chain)
-                    return [cert]
+    def get_certificate_summary(
+        self, fqdn: str, port: int = 443, timeout: Optional[int] = None
+    ) -> Optional[CertificateSummary]:
+        """
+        Get inventory fields of the leaf certificate without a full X.509 parse.
+
+        Uses fast_fetch and CertificateParser.parse_der_quick.
+
+        Args:
+            fqdn: Fully qualified domain name
+            port: Port number
+            timeout: Connection timeout (uses default if not provided)
+
+        Returns:
+            Certificate summary, or None if no certificate was received
 
-                return []
+        Raises:
+            socket.timeout: Connection timeout
+            socket.error: Connection error
+            ssl.SSLError: SSL/TLS error
+            ValueError: Malformed certificate
+        """
+        der_cert_chain = self._fetch_chain_der(
+            fqdn, port, timeout or self.timeout, fast_fetch=True, verify=False
+        )
+        if not der_cert_chain:
+            return None
+        return CertificateParser.parse_der_quick(der_cert_chain[0])
 
     def check_expiration(
-        self, cert: x509.Certificate, warning_days: int = 30
+        self, cert: x509.Certificate, warning_days: int = 30, now_ts: Optional[int] = None
     ) -> ExpirationInfo:
         """
         Check certificate expiration.
@@ -105,18 +371,21 @@ class RemoteCertChecker:
         Args:
             cert: Certificate to check
             warning_days: Days before expiration to trigger warning
+            now_ts: Current UNIX timestamp (uses current time if not provided)
 
         Returns:
             Expiration information
         """
         not_before, not_after = CertificateParser.get_validity_period(cert)
-        now = datetime.now(timezone.utc)
+        if now_ts is None:
+            now_ts = int(time.time())
+        not_after_ts = int(not_after.timestamp())
 
         # Calculate days remaining
-        days_remaining = (not_after - now).days
+        days_remaining = (not_after_ts - now_ts) // SECONDS_PER_DAY
 
         # Determine status
-        is_expired = now > not_after
+        is_expired = now_ts > not_after_ts
         is_warning = not is_expired and days_remaining < warning_days
 
         if is_expired:
@@ -137,7 +406,10 @@ class RemoteCertChecker:
 
     def verify_hostname(self, cert: x509.Certificate, fqdn: str) -> bool:
         """
-        Verify certificate hostname matches FQDN.
+        Verify certificate hostname matches FQDN (RFC 6125).
+
+        DNS names in the Subject Alternative Names take precedence; the
+        Common Name is only consulted when the certificate has none.
 
         Args:
             cert: Certificate to verify
@@ -146,54 +418,58 @@ class RemoteCertChecker:
         Returns:
             True if hostname matches
         """
-        # Check Common Name
-        cn = CertificateParser.get_subject_cn(cert)
-        if cn and self._match_hostname(cn, fqdn):
-            return True
+        hostname = fqdn.lower()
 
-        # Check Subject Alternative Names
-        san_list = CertificateParser.get_san(cert)
-        for san in san_list:
-            if self._match_hostname(san, fqdn):
-                return True
+        # Check Subject Alternative Names: exact names first, then wildcards
+        exact, wildcards = _san_index(cert)
+        if exact or wildcards:
+            return hostname in exact or any(
+                self._match_pattern(pattern, hostname) for pattern in wildcards
+            )
 
-        return False
+        # Fall back to Common Name
+        cn = CertificateParser.get_subject_cn(cert)
+        if not cn:
+            return False
+        return self._match_pattern(cn.lower(), hostname)
 
-    def _match_hostname(self, pattern: str, hostname: str) -> bool:
+    @staticmethod
+    def _match_pattern(pattern: str, hostname: str) -> bool:
         """
-        Match hostname against certificate pattern (supports wildcards).
+        Match lowercase hostname against lowercase certificate pattern.
+
+        A single "*" is allowed in the leftmost pattern label, either as the
+        whole label ("*.example.com") or as part of it ("api*.example.com").
+        It matches exactly one non-empty hostname label.
 
         Args:
-            pattern: Pattern from certificate (may contain *)
+            pattern: Name from certificate
             hostname: Hostname to check
 
         Returns:
             True if matches
         """
-        pattern = pattern.lower()
-        hostname = hostname.lower()
-
         # Exact match
         if pattern == hostname:
             return True
 
-        # Wildcard match
-        if pattern.startswith("*."):
-            pattern_parts = pattern.split(".")
-            hostname_parts = hostname.split(".")
-
-            # Must have same number of parts
-            if len(pattern_parts) != len(hostname_parts):
-                return False
-
-            # Check non-wildcard parts
-            for p, h in zip(pattern_parts[1:], hostname_parts[1:]):
-                if p != h:
-                    return False
-
-            return True
-
-        return False
+        # Wildcard match: everything after the first label must be equal
+        wildcard, _, tail = pattern.partition(".")
+        dot = hostname.find(".")
+        if not tail or dot <= 0 or hostname[dot + 1 :] != tail:
+            return False
+
+        # No wildcards inside IDNA A-labels
+        if wildcard.count("*") != 1 or wildcard.startswith("xn--"):
+            return False
+
+        label = hostname[:dot]
+        prefix, suffix = wildcard.split("*")
+        return (
+            len(label) >= len(prefix) + len(suffix)
+            and label.startswith(prefix)
+            and label.endswith(suffix)
+        )
 
     def check_host(
         self,
@@ -202,6 +478,10 @@ class RemoteCertChecker:
         warning_days: int = 30,
         host_name: Optional[str] = None,
         timeout: Optional[int] = None,
+        keep_chain: bool = False,
+        now_ts: Optional[int] = None,
+        fast_fetch: bool = False,
+        verify: bool = False,
     ) -> HostCheckResult:
         """
         Check certificate for a single host.
@@ -212,6 +492,10 @@ class RemoteCertChecker:
             warning_days: Days before expiration to trigger warning
             host_name: Friendly name for host
             timeout: Connection timeout
+            keep_chain: Whether to keep the full certificate chain in the result
+            now_ts: Current UNIX timestamp for expiration checks
+            fast_fetch: Fetch the certificate without completing the TLS handshake
+            verify: Verify chain and hostname in OpenSSL during the handshake
 
         Returns:
             Check result
@@ -220,7 +504,7 @@ class RemoteCertChecker:
 
         try:
             # Get certificate chain
-            cert_chain = self.get_certificate_chain(fqdn, port, timeout)
+            cert_chain = self.get_certificate_chain(fqdn, port, timeout, fast_fetch, verify)
 
             if not cert_chain:
                 return HostCheckResult(
@@ -235,10 +519,14 @@ class RemoteCertChecker:
             cert = cert_chain[0]
 
             # Check expiration
-            expiration = self.check_expiration(cert, warning_days)
+            expiration = self.check_expiration(cert, warning_days, now_ts)
 
-            # Verify hostname
-            hostname_valid = self.verify_hostname(cert, fqdn)
+            # Verify hostname (SAN names are indexed once per certificate)
+            if verify:
+                # Already verified by OpenSSL during the handshake
+                hostname_valid = True
+            else:
+                hostname_valid = self.verify_hostname(cert, fqdn)
 
             # Determine overall status
             status = expiration.status
@@ -251,7 +539,7 @@ class RemoteCertChecker:
                 port=port,
                 status=status,
                 certificate=cert,
-                certificate_chain=cert_chain,
+                certificate_chain=cert_chain if keep_chain else None,
                 expiration=expiration,
                 hostname_valid=hostname_valid,
             )
@@ -272,6 +560,14 @@ class RemoteCertChecker:
                 status=CertificateStatus.ERROR,
                 error=f"DNS resolution failed: {e}",
             )
+        except ssl.SSLCertVerificationError as e:
+            return HostCheckResult(
+                host_name=host_name,
+                fqdn=fqdn,
+                port=port,
+                status=CertificateStatus.ERROR,
+                error=f"Certificate verification failed: {e.verify_message or e}",
+            )
         except (socket.error, ssl.SSLError) as e:
             return HostCheckResult(
                 host_name=host_name,
@@ -289,38 +585,95 @@ class RemoteCertChecker:
                 error=f"Unexpected error: {e}",
             )
 
-    def check_all_hosts(self, config: Config) -> List[HostCheckResult]:
+    def check_all_hosts(
+        self, config: Config, verify: bool = False, fast_fetch: bool = False
+    ) -> List[HostCheckResult]:
         """
         Check all enabled hosts from configuration.
 
+        Hosts are checked concurrently; results keep the configuration order.
+
         Args:
             config: Configuration with hosts to check
+            verify: Verify chain and hostname in OpenSSL during the handshake
+            fast_fetch: Fetch certificates without completing the TLS handshake
 
         Returns:
             List of check results
         """
-        results = []
-        enabled_hosts = config.get_enabled_hosts()
-
-        for host_config in enabled_hosts:
-            result = self.check_host(
-                fqdn=host_config.fqdn,
-                port=host_config.port,
-                warning_days=host_config.warning_days,
-                host_name=host_config.name,
-                timeout=config.settings.timeout,
+        return self.check_hosts(
+            config.get_enabled_hosts(), config.settings.timeout, verify, fast_fetch
+        )
+
+    def check_hosts(
+        self,
+        hosts: List[HostConfig],
+        timeout: int = 10,
+        verify: bool = False,
+        fast_fetch: bool = False,
+    ) -> List[HostCheckResult]:
+        """
+        Check the given hosts concurrently.
+
+        Args:
+            hosts: Host configurations to check
+            timeout: Connection timeout
+            verify: Verify chain and hostname in OpenSSL during the handshake
+            fast_fetch: Fetch certificates without completing the TLS handshake
+
+        Returns:
+            List of check results, in the order of hosts
+        """
+        if not hosts:
+            return []
+
+        max_workers = max(1, min(self.max_workers, len(hosts)))
+        # Same reference time for every host in the run
+        now_ts = int(time.time())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Resolve each distinct host once; failures are reported by check_host
+            addresses = {(host.fqdn, host.port) for host in hosts}
+            list(executor.map(lambda address: self._try_resolve(*address), addresses))
+
+            return list(
+                executor.map(
+                    lambda host_config: self.check_host_config(
+                        host_config, timeout, now_ts, verify, fast_fetch
+                    ),
+                    hosts,
+                )
             )
-            results.append(result)
 
-        return results
+    def check_all_hosts_batch(self, config: Config) -> HostCheckResultBatch:
+        """
+        Check all enabled hosts and return column-oriented results.
+
+        Args:
+            config: Configuration with hosts to check
 
-    def check_host_config(self, host_config: HostConfig, timeout: int = 10) -> HostCheckResult:
+        Returns:
+            Batch of check results
+        """
+        return HostCheckResultBatch.from_results(self.check_all_hosts(config))
+
+    def check_host_config(
+        self,
+        host_config: HostConfig,
+        timeout: int = 10,
+        now_ts: Optional[int] = None,
+        verify: bool = False,
+        fast_fetch: bool = False,
+    ) -> HostCheckResult:
         """
         Check a single host from configuration.
 
         Args:
             host_config: Host configuration
             timeout: Connection timeout
+            now_ts: Current UNIX timestamp for expiration checks
+            verify: Verify chain and hostname in OpenSSL during the handshake
+            fast_fetch: Fetch the certificate without completing the TLS handshake
 
         Returns:
             Check result
@@ -331,4 +684,7 @@ class RemoteCertChecker:
             warning_days=host_config.warning_days,
             host_name=host_config.name,
             timeout=timeout,
+            now_ts=now_ts,
+            fast_fetch=fast_fetch,
+            verify=verify,
         )
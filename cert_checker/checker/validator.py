@@ -1,21 +1,84 @@
 """Certificate chain validation."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
-from typing import List, Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from cryptography import x509
 from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa, ec, dsa
 from cryptography.x509.oid import ExtensionOID
 
+from cert_checker.utils.cert_parser import _ext_map
 
-class ValidationStatus(Enum):
+
+def _verify_rsa(public_key: Any, cert: x509.Certificate) -> None:
+    """RSA signature verification."""
+    public_key.verify(
+        cert.signature,
+        cert.tbs_certificate_bytes,
+        padding.PKCS1v15(),
+        cert.signature_hash_algorithm,
+    )
+
+
+def _verify_ec(public_key: Any, cert: x509.Certificate) -> None:
+    """ECDSA signature verification."""
+    public_key.verify(
+        cert.signature,
+        cert.tbs_certificate_bytes,
+        ec.ECDSA(cert.signature_hash_algorithm),
+    )
+
+
+def _verify_dsa(public_key: Any, cert: x509.Certificate) -> None:
+    """DSA signature verification."""
+    public_key.verify(
+        cert.signature,
+        cert.tbs_certificate_bytes,
+        cert.signature_hash_algorithm,
+    )
+
+
+_Verifier = Callable[[Any, x509.Certificate], None]
+
+_VERIFIERS: Dict[type, _Verifier] = {
+    rsa.RSAPublicKey: _verify_rsa,
+    ec.EllipticCurvePublicKey: _verify_ec,
+    dsa.DSAPublicKey: _verify_dsa,
+}
+
+# Concrete key class -> verifier (key classes are backend subclasses of the ABCs)
+_VERIFIERS_BY_TYPE: Dict[type, Optional[_Verifier]] = {}
+
+
+def _get_verifier(public_key: Any) -> Optional[_Verifier]:
+    """Get signature verifier for a public key, or None if unsupported."""
+    key_type = type(public_key)
+    try:
+        return _VERIFIERS_BY_TYPE[key_type]
+    except KeyError:
+        verifier = next(
+            (fn for base, fn in _VERIFIERS.items() if isinstance(public_key, base)), None
+        )
+        _VERIFIERS_BY_TYPE[key_type] = verifier
+        return verifier
+
+
+class ValidationStatus(IntEnum):
     """Validation status enumeration."""
 
-    VALID = "valid"
-    INVALID = "invalid"
-    WARNING = "warning"
+    VALID = 0
+    WARNING = 1
+    INVALID = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase status name used in output."""
+        return self.name.lower()
 
 
 @dataclass
@@ -30,18 +93,43 @@ class ValidationResult:
 class CertificateValidator:
     """Certificate chain validator."""
 
-    def __init__(self, truststore: Optional[List[x509.Certificate]] = None):
+    def __init__(
+        self,
+        truststore: Optional[List[x509.Certificate]] = None,
+        trust_lookup: Optional[Callable[[x509.Name], List[x509.Certificate]]] = None,
+    ):
         """
         Initialize validator.
 
         Args:
             truststore: List of trusted root certificates
+            trust_lookup: Callable returning trusted certificates for a subject
+                name (e.g. TruststoreManager.find_by_subject), used in addition
+                to truststore without copying the whole store
         """
         self.truststore = truststore or []
+        self.trust_lookup = trust_lookup
+
+        # Trusted certificates indexed by DER-encoded subject name
+        self._truststore_by_subject: Dict[bytes, List[x509.Certificate]] = {}
+        for cert in self.truststore:
+            self._index_trusted_cert(cert)
+
+    def _index_trusted_cert(self, cert: x509.Certificate) -> None:
+        """Add a trusted certificate to the subject index."""
+        self._truststore_by_subject.setdefault(cert.subject.public_bytes(), []).append(cert)
 
     def add_trusted_cert(self, cert: x509.Certificate) -> None:
         """Add a trusted certificate to truststore."""
         self.truststore.append(cert)
+        self._index_trusted_cert(cert)
+
+    def _find_trusted(self, subject: x509.Name) -> List[x509.Certificate]:
+        """Get trusted certificates with the given subject name."""
+        candidates = self._truststore_by_subject.get(subject.public_bytes(), [])
+        if self.trust_lookup is not None:
+            candidates = candidates + self.trust_lookup(subject)
+        return candidates
 
     def verify_signature(
         self, cert: x509.Certificate, issuer_cert: x509.Certificate
@@ -59,35 +147,12 @@ class CertificateValidator:
         try:
             public_key = issuer_cert.public_key()
 
-            # Get signature algorithm
-            sig_algorithm = cert.signature_algorithm_oid._name
-
-            # Verify based on key type
-            if isinstance(public_key, rsa.RSAPublicKey):
-                # RSA signature verification
-                public_key.verify(
-                    cert.signature,
-                    cert.tbs_certificate_bytes,
-                    padding.PKCS1v15(),
-                    cert.signature_hash_algorithm,
-                )
-            elif isinstance(public_key, ec.EllipticCurvePublicKey):
-                # ECDSA signature verification
-                public_key.verify(
-                    cert.signature,
-                    cert.tbs_certificate_bytes,
-                    ec.ECDSA(cert.signature_hash_algorithm),
-                )
-            elif isinstance(public_key, dsa.DSAPublicKey):
-                # DSA signature verification
-                public_key.verify(
-                    cert.signature,
-                    cert.tbs_certificate_bytes,
-                    cert.signature_hash_algorithm,
-                )
-            else:
+            # Dispatch on key type
+            verifier = _get_verifier(public_key)
+            if verifier is None:
                 return False
 
+            verifier(public_key, cert)
             return True
 
         except InvalidSignature:
@@ -107,33 +172,27 @@ class CertificateValidator:
         """
         messages = []
 
-        try:
-            # Check Key Usage
-            key_usage = cert.extensions.get_extension_for_oid(ExtensionOID.KEY_USAGE)
-
-            # For CA certificates
-            try:
-                basic_constraints = cert.extensions.get_extension_for_oid(
-                    ExtensionOID.BASIC_CONSTRAINTS
-                )
-                if basic_constraints.value.ca:
-                    # CA cert should have key_cert_sign
-                    if not key_usage.value.key_cert_sign:
-                        messages.append("CA certificate missing key_cert_sign usage")
-                        return ValidationResult(
-                            status=ValidationStatus.INVALID,
-                            messages=messages,
-                            is_valid=False,
-                        )
-            except x509.ExtensionNotFound:
-                pass
-
-        except x509.ExtensionNotFound:
+        # Check Key Usage
+        extensions = _ext_map(cert)
+        key_usage = extensions.get(ExtensionOID.KEY_USAGE)
+        if key_usage is None:
             messages.append("Key usage extension not found")
             return ValidationResult(
                 status=ValidationStatus.WARNING, messages=messages, is_valid=True
             )
 
+        # For CA certificates
+        basic_constraints = extensions.get(ExtensionOID.BASIC_CONSTRAINTS)
+        if basic_constraints is not None and basic_constraints.ca:
+            # CA cert should have key_cert_sign
+            if not key_usage.key_cert_sign:
+                messages.append("CA certificate missing key_cert_sign usage")
+                return ValidationResult(
+                    status=ValidationStatus.INVALID,
+                    messages=messages,
+                    is_valid=False,
+                )
+
         return ValidationResult(
             status=ValidationStatus.VALID, messages=["Key usage valid"], is_valid=True
         )
@@ -150,32 +209,31 @@ class CertificateValidator:
         """
         messages = []
 
-        try:
-            basic_constraints = cert.extensions.get_extension_for_oid(
-                ExtensionOID.BASIC_CONSTRAINTS
-            )
-
-            if basic_constraints.value.ca:
-                messages.append("Certificate is a CA certificate")
-                if basic_constraints.value.path_length is not None:
-                    messages.append(
-                        f"Path length constraint: {basic_constraints.value.path_length}"
-                    )
-            else:
-                messages.append("Certificate is not a CA certificate")
-
-        except x509.ExtensionNotFound:
+        basic_constraints = _ext_map(cert).get(ExtensionOID.BASIC_CONSTRAINTS)
+        if basic_constraints is None:
             messages.append("Basic constraints extension not found")
             return ValidationResult(
                 status=ValidationStatus.WARNING, messages=messages, is_valid=True
             )
 
+        if basic_constraints.ca:
+            messages.append("Certificate is a CA certificate")
+            if basic_constraints.path_length is not None:
+                messages.append(
+                    f"Path length constraint: {basic_constraints.path_length}"
+                )
+        else:
+            messages.append("Certificate is not a CA certificate")
+
         return ValidationResult(
             status=ValidationStatus.VALID, messages=messages, is_valid=True
         )
 
     def validate_chain(
-        self, cert_chain: List[x509.Certificate], use_truststore: bool = True
+        self,
+        cert_chain: List[x509.Certificate],
+        use_truststore: bool = True,
+        verbose: bool = False,
     ) -> ValidationResult:
         """
         Validate certificate chain.
@@ -183,11 +241,12 @@ class CertificateValidator:
         Args:
             cert_chain: Certificate chain (leaf first)
             use_truststore: Whether to validate against truststore
+            verbose: Also collect informational messages (failures are always reported)
 
         Returns:
             Validation result
         """
-        messages = []
+        messages: List[str] = []
 
         if not cert_chain:
             return ValidationResult(
@@ -198,13 +257,15 @@ class CertificateValidator:
 
         # Validate each certificate in chain
         for i, cert in enumerate(cert_chain):
-            # Check basic constraints
-            bc_result = self.check_basic_constraints(cert)
-            messages.extend([f"Cert {i}: {msg}" for msg in bc_result.messages])
+            # Check basic constraints (informational only)
+            if verbose:
+                bc_result = self.check_basic_constraints(cert)
+                messages.extend(f"Cert {i}: {msg}" for msg in bc_result.messages)
 
             # Check key usage
             ku_result = self.check_key_usage(cert)
-            messages.extend([f"Cert {i}: {msg}" for msg in ku_result.messages])
+            if verbose or not ku_result.is_valid:
+                messages.extend(f"Cert {i}: {msg}" for msg in ku_result.messages)
 
             if not ku_result.is_valid:
                 return ValidationResult(
@@ -237,21 +298,21 @@ class CertificateValidator:
                     messages=messages,
                     is_valid=False,
                 )
-            else:
+            elif verbose:
                 messages.append(f"Cert {i}: Signature valid")
 
         # Check root certificate against truststore
-        if use_truststore and self.truststore:
+        if use_truststore and (self.truststore or self.trust_lookup is not None):
             root_cert = cert_chain[-1]
             found_in_truststore = False
 
-            for trusted_cert in self.truststore:
-                if root_cert.subject == trusted_cert.subject:
-                    # Verify root cert signature with trusted cert
-                    if self.verify_signature(root_cert, trusted_cert):
-                        found_in_truststore = True
+            for trusted_cert in self._find_trusted(root_cert.subject):
+                # Verify root cert signature with trusted cert
+                if self.verify_signature(root_cert, trusted_cert):
+                    found_in_truststore = True
+                    if verbose:
                         messages.append("Root certificate found in truststore")
-                        break
+                    break
 
             if not found_in_truststore:
                 messages.append("Root certificate not found in truststore")
@@ -267,6 +328,54 @@ class CertificateValidator:
             is_valid=True,
         )
 
+    def validate_chains(
+        self,
+        der_chains: Sequence[Sequence[bytes]],
+        use_truststore: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """
+        Validate many DER-encoded chains across worker processes.
+
+        Signature verification is CPU-bound, so chains are spread over all
+        cores. Certificates travel as DER bytes since x509 objects cannot
+        be pickled. Only the truststore list is sent to the workers;
+        trust_lookup is not used.
+
+        Args:
+            der_chains: Certificate chains as DER bytes (leaf first)
+            use_truststore: Whether to validate against truststore
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            Validation results in input order
+        """
+        if not der_chains:
+            return []
+
+        truststore_der = [
+            cert.public_bytes(serialization.Encoding.DER) for cert in self.truststore
+        ]
+        chunksize = max(1, len(der_chains) // (4 * (max_workers or os.cpu_count() or 1)))
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_validator,
+            initargs=(truststore_der,),
+        ) as executor:
+            outcomes = executor.map(
+                _validate_der_chain,
+                [list(chain) for chain in der_chains],
+                [use_truststore] * len(der_chains),
+                chunksize=chunksize,
+            )
+            return [
+                ValidationResult(
+                    status=ValidationStatus(status), messages=messages, is_valid=is_valid
+                )
+                for status, messages, is_valid in outcomes
+            ]
+
     def validate_single(self, cert: x509.Certificate) -> ValidationResult:
         """
         Validate a single certificate (without chain validation).
@@ -311,3 +420,29 @@ class CertificateValidator:
             messages=messages,
             is_valid=True,
         )
+
+
+# Per-process validator used by CertificateValidator.validate_chains
+_worker_validator: Optional[CertificateValidator] = None
+
+
+def _init_worker_validator(truststore_der: List[bytes]) -> None:
+    """Build the worker process validator from DER-encoded trusted certs."""
+    global _worker_validator
+    _worker_validator = CertificateValidator(
+        [x509.load_der_x509_certificate(der) for der in truststore_der]
+    )
+
+
+def _validate_der_chain(
+    der_chain: List[bytes], use_truststore: bool
+) -> Tuple[int, List[str], bool]:
+    """Validate a DER chain in a worker process, returning a compact tuple."""
+    validator = _worker_validator or CertificateValidator()
+    try:
+        cert_chain = [x509.load_der_x509_certificate(der) for der in der_chain]
+    except ValueError as e:
+        return ValidationStatus.INVALID, [f"Failed to parse certificate: {e}"], False
+
+    result = validator.validate_chain(cert_chain, use_truststore=use_truststore)
+    return result.status, result.messages, result.is_valid
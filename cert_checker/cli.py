@@ -1,22 +1,45 @@
 """Command-line interface for cert-checker."""
 
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
 
-from cert_checker.checker.remote import RemoteCertChecker
-from cert_checker.checker.validator import CertificateValidator
-from cert_checker.config import Config
-from cert_checker.store.converter import CertificateConverter
-from cert_checker.store.keystore import KeystoreManager
-from cert_checker.store.truststore import TruststoreManager
-from cert_checker.utils.cert_parser import CertificateParser
-from cert_checker.utils.display import DisplayFormatter
+# Checker, store, parser and display modules pull in cryptography/pydantic
+# and are imported inside the commands that need them to keep --help fast.
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
-formatter = DisplayFormatter(console)
+    from cert_checker.utils.display import DisplayFormatter
+
+
+# Option types shared across commands
+_EXISTING_PATH = click.Path(exists=True, path_type=Path)
+_OUTPUT_PATH = click.Path(path_type=Path)
+_TRUSTSTORE_FORMAT = click.Choice(["jks", "pkcs12", "pem"], case_sensitive=False)
+_KEYSTORE_FORMAT = click.Choice(["jks", "pkcs12"], case_sensitive=False)
+_KEY_EXPORT_FORMAT = click.Choice(["pkcs12", "pem"], case_sensitive=False)
+_CERT_EXPORT_FORMAT = click.Choice(["pem", "der"], case_sensitive=False)
+_CONVERT_FORMAT = click.Choice(["pem", "der", "pkcs12", "jks"], case_sensitive=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Get the shared console (terminal is probed on first use)."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=None)
+def get_formatter() -> "DisplayFormatter":
+    """Get the shared display formatter (imported on first use)."""
+    from cert_checker.utils.display import DisplayFormatter
+
+    return DisplayFormatter(get_console())
 
 
 @click.group()
@@ -30,60 +53,80 @@ def cli() -> None:
 @click.option(
     "--config",
     "-c",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Configuration file path",
 )
 @click.option("--host", "-h", help="Host FQDN to check")
 @click.option("--port", "-p", type=int, default=443, help="Port number (default: 443)")
 @click.option("--timeout", "-t", type=int, default=10, help="Connection timeout (default: 10)")
 @click.option("--warning-days", "-w", type=int, default=30, help="Warning threshold in days")
+@click.option(
+    "--verify", is_flag=True, help="Verify chain and hostname against system CAs during handshake"
+)
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Read certificates from the server hello without completing the handshake",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=32,
+    help="Hosts checked concurrently from config (default: 32)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
 @click.option("--csv", "output_csv", is_flag=True, help="Output as CSV")
+@click.option(
+    "--config-cache", is_flag=True, help="Cache the parsed config next to it (<config>.cache.json)"
+)
 def check(
     config: Optional[Path],
     host: Optional[str],
     port: int,
     timeout: int,
     warning_days: int,
+    verify: bool,
+    fast: bool,
+    workers: int,
     verbose: bool,
     output_json: bool,
     output_csv: bool,
+    config_cache: bool,
 ) -> None:
     """Check SSL/TLS certificates on remote hosts."""
-    checker = RemoteCertChecker(timeout=timeout)
+    from cert_checker.checker.remote import RemoteCertChecker
+    from cert_checker.config import Config
+
+    checker = RemoteCertChecker(timeout=timeout, max_workers=workers)
 
     if config:
         # Check hosts from config file
         try:
-            cfg = Config.from_file(config)
-            results = checker.check_all_hosts(cfg)
+            cfg = Config.from_file(config, use_cache=config_cache)
+            results = checker.check_all_hosts(cfg, verify=verify, fast_fetch=fast)
         except Exception as e:
-            console.print(f"[bold red]Error loading config:[/bold red] {e}")
+            get_console().print(f"[bold red]Error loading config:[/bold red] {e}")
             raise click.Abort()
     elif host:
         # Check single host
-        result = checker.check_host(host, port, warning_days)
+        result = checker.check_host(host, port, warning_days, fast_fetch=fast, verify=verify)
         results = [result]
     else:
-        console.print("[bold red]Error:[/bold red] Either --config or --host must be provided")
+        get_console().print(
+            "[bold red]Error:[/bold red] Either --config or --host must be provided"
+        )
         raise click.Abort()
 
-    # Output results
+    # Output results (machine-readable output bypasses Rich markup, highlighting and wrapping)
+    formatter = get_formatter()
     if output_json:
-        console.print(formatter.export_json(results))
+        sys.stdout.writelines(formatter.iter_export_json(results))
+        sys.stdout.write("\n")
     elif output_csv:
-        console.print(formatter.export_csv(results))
+        sys.stdout.writelines(formatter.iter_export_csv(results))
     else:
-        if len(results) == 1:
-            formatter.format_check_result(results[0], verbose=verbose)
-        else:
-            formatter.print_summary_table(results)
-
-            if verbose:
-                console.print()
-                for result in results:
-                    formatter.format_check_result(result, verbose=True)
+        formatter.print_check_results(results, verbose=verbose)
 
 
 @cli.group()
@@ -96,7 +139,7 @@ def truststore() -> None:
 @click.option(
     "--store",
     "-s",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Truststore path",
 )
@@ -104,23 +147,28 @@ def truststore() -> None:
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["jks", "pkcs12", "pem"], case_sensitive=False),
+    type=_TRUSTSTORE_FORMAT,
     default="jks",
     help="Truststore format",
 )
-def truststore_list(store: Path, password: Optional[str], format: str) -> None:
+@click.option("--fingerprints", is_flag=True, help="Show SHA-256 fingerprints")
+def truststore_list(
+    store: Path, password: Optional[str], format: str, fingerprints: bool
+) -> None:
     """List certificates in truststore."""
+    from cert_checker.store.truststore import TruststoreManager
+
     try:
         ts = TruststoreManager(path=store, password=password, format=format)
         entries = ts.list_certificates()
 
         if not entries:
-            console.print("[yellow]No certificates found in truststore[/yellow]")
+            get_console().print("[yellow]No certificates found in truststore[/yellow]")
         else:
-            formatter.print_truststore_table(entries)
+            get_formatter().print_truststore_table(entries, fingerprints=fingerprints)
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -128,19 +176,19 @@ def truststore_list(store: Path, password: Optional[str], format: str) -> None:
 @click.option(
     "--store",
     "-s",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     required=True,
     help="Truststore path",
 )
 @click.option(
-    "--cert", "-c", type=click.Path(exists=True, path_type=Path), required=True, help="Certificate file"
+    "--cert", "-c", type=_EXISTING_PATH, required=True, help="Certificate file"
 )
 @click.option("--alias", "-a", required=True, help="Certificate alias")
 @click.option("--password", "-p", help="Truststore password")
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["jks", "pkcs12", "pem"], case_sensitive=False),
+    type=_TRUSTSTORE_FORMAT,
     default="jks",
     help="Truststore format",
 )
@@ -148,6 +196,8 @@ def truststore_add(
     store: Path, cert: Path, alias: str, password: Optional[str], format: str
 ) -> None:
     """Add certificate to truststore."""
+    from cert_checker.store.truststore import TruststoreManager
+
     try:
         # Load or create truststore
         if store.exists():
@@ -161,12 +211,12 @@ def truststore_add(
         # Save truststore
         ts.save(store, password)
 
-        console.print(
+        get_console().print(
             f"[green]✓[/green] Certificate added successfully with alias: {actual_alias}"
         )
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -174,7 +224,7 @@ def truststore_add(
 @click.option(
     "--store",
     "-s",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Truststore path",
 )
@@ -183,23 +233,25 @@ def truststore_add(
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["jks", "pkcs12", "pem"], case_sensitive=False),
+    type=_TRUSTSTORE_FORMAT,
     default="jks",
     help="Truststore format",
 )
 def truststore_remove(store: Path, alias: str, password: Optional[str], format: str) -> None:
     """Remove certificate from truststore."""
+    from cert_checker.store.truststore import TruststoreManager
+
     try:
         ts = TruststoreManager(path=store, password=password, format=format)
 
         if ts.remove_certificate(alias):
             ts.save(store, password)
-            console.print(f"[green]✓[/green] Certificate '{alias}' removed successfully")
+            get_console().print(f"[green]✓[/green] Certificate '{alias}' removed successfully")
         else:
-            console.print(f"[yellow]Certificate '{alias}' not found[/yellow]")
+            get_console().print(f"[yellow]Certificate '{alias}' not found[/yellow]")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -207,24 +259,24 @@ def truststore_remove(store: Path, alias: str, password: Optional[str], format:
 @click.option(
     "--store",
     "-s",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Truststore path",
 )
 @click.option("--alias", "-a", required=True, help="Certificate alias")
 @click.option(
-    "--output", "-o", type=click.Path(path_type=Path), required=True, help="Output file path"
+    "--output", "-o", type=_OUTPUT_PATH, required=True, help="Output file path"
 )
 @click.option("--password", "-p", help="Truststore password")
 @click.option(
     "--store-format",
-    type=click.Choice(["jks", "pkcs12", "pem"], case_sensitive=False),
+    type=_TRUSTSTORE_FORMAT,
     default="jks",
     help="Truststore format",
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["pem", "der"], case_sensitive=False),
+    type=_CERT_EXPORT_FORMAT,
     default="pem",
     help="Output format",
 )
@@ -237,13 +289,15 @@ def truststore_export(
     output_format: str,
 ) -> None:
     """Export certificate from truststore."""
+    from cert_checker.store.truststore import TruststoreManager
+
     try:
         ts = TruststoreManager(path=store, password=password, format=store_format)
         ts.export_certificate(alias, output, output_format)
-        console.print(f"[green]✓[/green] Certificate exported to {output}")
+        get_console().print(f"[green]✓[/green] Certificate exported to {output}")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -257,7 +311,7 @@ def keystore() -> None:
 @click.option(
     "--store",
     "-s",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Keystore path",
 )
@@ -265,23 +319,28 @@ def keystore() -> None:
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["jks", "pkcs12"], case_sensitive=False),
+    type=_KEYSTORE_FORMAT,
     default="pkcs12",
     help="Keystore format",
 )
-def keystore_list(store: Path, password: Optional[str], format: str) -> None:
+@click.option("--fingerprints", is_flag=True, help="Show SHA-256 fingerprints")
+def keystore_list(
+    store: Path, password: Optional[str], format: str, fingerprints: bool
+) -> None:
     """List entries in keystore."""
+    from cert_checker.store.keystore import KeystoreManager
+
     try:
         ks = KeystoreManager(path=store, password=password, format=format)
         entries = ks.list_entries()
 
         if not entries:
-            console.print("[yellow]No entries found in keystore[/yellow]")
+            get_console().print("[yellow]No entries found in keystore[/yellow]")
         else:
-            formatter.print_keystore_table(entries)
+            get_formatter().print_keystore_table(entries, fingerprints=fingerprints)
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -289,25 +348,25 @@ def keystore_list(store: Path, password: Optional[str], format: str) -> None:
 @click.option(
     "--store",
     "-s",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Keystore path",
 )
 @click.option("--alias", "-a", required=True, help="Entry alias")
 @click.option(
-    "--output", "-o", type=click.Path(path_type=Path), required=True, help="Output file path"
+    "--output", "-o", type=_OUTPUT_PATH, required=True, help="Output file path"
 )
 @click.option("--password", "-p", help="Keystore password")
 @click.option("--export-password", help="Export file password")
 @click.option(
     "--store-format",
-    type=click.Choice(["jks", "pkcs12"], case_sensitive=False),
+    type=_KEYSTORE_FORMAT,
     default="pkcs12",
     help="Keystore format",
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["pkcs12", "pem"], case_sensitive=False),
+    type=_KEY_EXPORT_FORMAT,
     default="pkcs12",
     help="Output format",
 )
@@ -321,13 +380,15 @@ def keystore_export(
     output_format: str,
 ) -> None:
     """Export entry from keystore."""
+    from cert_checker.store.keystore import KeystoreManager
+
     try:
         ks = KeystoreManager(path=store, password=password, format=store_format)
         ks.export_entry(alias, output, output_format, export_password)
-        console.print(f"[green]✓[/green] Entry exported to {output}")
+        get_console().print(f"[green]✓[/green] Entry exported to {output}")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -336,24 +397,24 @@ def keystore_export(
     "--input",
     "-i",
     "input_path",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Input file",
 )
 @click.option(
-    "--output", "-o", type=click.Path(path_type=Path), required=True, help="Output file"
+    "--output", "-o", type=_OUTPUT_PATH, required=True, help="Output file"
 )
 @click.option(
     "--from",
     "from_format",
-    type=click.Choice(["pem", "der", "pkcs12", "jks"], case_sensitive=False),
+    type=_CONVERT_FORMAT,
     required=True,
     help="Source format",
 )
 @click.option(
     "--to",
     "to_format",
-    type=click.Choice(["pem", "der", "pkcs12", "jks"], case_sensitive=False),
+    type=_CONVERT_FORMAT,
     required=True,
     help="Target format",
 )
@@ -362,14 +423,16 @@ def convert(
     input_path: Path, output: Path, from_format: str, to_format: str, password: Optional[str]
 ) -> None:
     """Convert certificate between formats."""
+    from cert_checker.store.converter import CertificateConverter
+
     try:
         CertificateConverter.convert(input_path, output, from_format, to_format, password)
-        console.print(
+        get_console().print(
             f"[green]✓[/green] Converted {from_format.upper()} to {to_format.upper()}: {output}"
         )
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -377,20 +440,20 @@ def convert(
 @click.option(
     "--cert",
     "-c",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     required=True,
     help="Certificate file",
 )
 @click.option(
     "--chain",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     multiple=True,
     help="Chain certificate files",
 )
 @click.option(
     "--truststore",
     "-t",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Truststore for validation",
 )
 @click.option("--truststore-password", help="Truststore password")
@@ -403,52 +466,53 @@ def validate(
     verbose: bool,
 ) -> None:
     """Validate certificate and chain."""
+    from cert_checker.checker.validator import CertificateValidator
+    from cert_checker.store.truststore import TruststoreManager
+    from cert_checker.utils.cert_parser import CertificateParser
+
     try:
-        # Load certificate
-        with open(cert, "r") as f:
-            cert_data = f.read()
-        certificate = CertificateParser.parse_pem(cert_data)
-
-        # Build chain
-        cert_chain = [certificate]
-        for chain_file in chain:
-            with open(chain_file, "r") as f:
-                chain_data = f.read()
-            chain_cert = CertificateParser.parse_pem(chain_data)
-            cert_chain.append(chain_cert)
-
-        # Load truststore if provided
-        trusted_certs = []
+        # Load certificate and chain in one pass (files may be PEM bundles);
+        # reads overlap, which helps with many files on slow or network storage
+        paths = (cert, *chain)
+        with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+            pem_data = b"\n".join(executor.map(Path.read_bytes, paths))
+        cert_chain = CertificateParser.parse_pem_many(pem_data)
+        certificate = cert_chain[0]
+
+        # Load truststore if provided (looked up by subject, not copied)
+        trust_lookup = None
         if truststore:
             ts = TruststoreManager(path=truststore, password=truststore_password, format="jks")
-            trusted_certs = [entry.certificate for entry in ts.list_certificates()]
+            trust_lookup = ts.find_by_subject
 
         # Validate
-        validator = CertificateValidator(truststore=trusted_certs)
-        result = validator.validate_chain(cert_chain, use_truststore=bool(truststore))
+        validator = CertificateValidator(trust_lookup=trust_lookup)
+        result = validator.validate_chain(
+            cert_chain, use_truststore=bool(truststore), verbose=verbose
+        )
 
         # Display results
         if result.is_valid:
-            console.print("[bold green]✓ Certificate chain is valid[/bold green]")
+            get_console().print("[bold green]✓ Certificate chain is valid[/bold green]")
         else:
-            console.print("[bold red]✗ Certificate chain is INVALID[/bold red]")
+            get_console().print("[bold red]✗ Certificate chain is INVALID[/bold red]")
 
         if verbose or not result.is_valid:
-            console.print("\n[bold]Validation Details:[/bold]")
+            get_console().print("\n[bold]Validation Details:[/bold]")
             for msg in result.messages:
-                console.print(f"  • {msg}")
+                get_console().print(f"  • {msg}")
 
         # Display certificate info
         if verbose:
-            console.print()
-            formatter.format_certificate(certificate, verbose=True)
+            get_console().print()
+            get_formatter().format_certificate(certificate, verbose=True)
 
             if len(cert_chain) > 1:
-                console.print()
-                formatter.format_chain(cert_chain)
+                get_console().print()
+                get_formatter().format_chain(cert_chain)
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
@@ -456,25 +520,28 @@ def validate(
 @click.option(
     "--config",
     "-c",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_PATH,
     help="Configuration file path",
 )
-def tui(config: Optional[Path]) -> None:
+@click.option(
+    "--config-cache", is_flag=True, help="Cache the parsed config next to it (<config>.cache.json)"
+)
+def tui(config: Optional[Path], config_cache: bool) -> None:
     """Launch interactive TUI (Text User Interface)."""
     try:
         from cert_checker.tui import CertCheckerApp
 
-        app = CertCheckerApp(config_path=config)
+        app = CertCheckerApp(config_path=config, config_cache=config_cache)
         app.run()
 
     except ImportError:
-        console.print(
+        get_console().print(
             "[bold red]Error:[/bold red] TUI dependencies not installed. "
             "Install with: pip install textual"
         )
         raise click.Abort()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise click.Abort()
 
 
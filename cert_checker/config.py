@@ -1,13 +1,33 @@
 """Configuration parser for cert-checker."""
 
+import json
 import os
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 from pydantic import BaseModel, Field, field_validator
 
+# ${VAR_NAME} references in password fields
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Single DNS label (letters, digits, inner hyphens)
+_FQDN_LABEL_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$")
+
+# Whole FQDN: two or more labels of 1-63 characters each
+_FQDN_RE = re.compile(
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+"
+)
+
+# Bump when the cached layout or the models change incompatibly
+_CACHE_VERSION = 2
+
 
 class StoreConfig(BaseModel):
     """Store configuration."""
@@ -24,12 +44,7 @@ class StoreConfig(BaseModel):
         if v is None:
             return None
         # Support ${VAR_NAME} syntax
-        pattern = re.compile(r"\$\{([^}]+)\}")
-        matches = pattern.findall(v)
-        for match in matches:
-            env_value = os.environ.get(match, "")
-            v = v.replace(f"${{{match}}}", env_value)
-        return v
+        return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), ""), v)
 
 
 class HostConfig(BaseModel):
@@ -48,16 +63,21 @@ class HostConfig(BaseModel):
         """Validate FQDN format."""
         if not v or len(v) > 253:
             raise ValueError("Invalid FQDN length")
-        # Basic FQDN validation
+        if not v.isascii():
+            raise ValueError("Invalid FQDN format")
+        # Common case: whole name valid in a single match
+        if _FQDN_RE.fullmatch(v):
+            return v
+        # Basic FQDN validation (finds which rule failed)
         parts = v.split(".")
         if len(parts) < 2:
             raise ValueError("FQDN must have at least two parts")
         for part in parts:
             if not part or len(part) > 63:
                 raise ValueError("Invalid FQDN part length")
-            if not re.match(r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$", part):
+            if not _FQDN_LABEL_RE.match(part):
                 raise ValueError("Invalid FQDN format")
-        return v
+        raise ValueError("Invalid FQDN format")
 
 
 class SettingsConfig(BaseModel):
@@ -77,28 +97,120 @@ class Config(BaseModel):
     hosts: List[HostConfig] = Field(default_factory=list)
 
     @classmethod
-    def from_file(cls, path: Path) -> "Config":
-        """Load configuration from TOML file."""
+    def from_file(cls, path: Path, use_cache: bool = False, validate: bool = True) -> "Config":
+        """
+        Load configuration from TOML file.
+
+        With use_cache, the validated configuration is cached as JSON next
+        to the file (``<name>.cache.json``) and reused while the TOML's
+        modification time and size match the ones recorded in the cache.
+        The stores section is cached unexpanded, so environment variables
+        are read on every load and never written to the cache.
+
+        Args:
+            path: Path to TOML file
+            use_cache: Whether to read and write the JSON cache
+            validate: Validate settings and hosts (unvalidated loads are not cached)
+
+        Returns:
+            Configuration
+        """
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        with open(path, "r") as f:
-            data = toml.load(f)
+        cache_path = path.with_suffix(path.suffix + ".cache.json")
+        if use_cache:
+            config = cls._load_cache(path, cache_path)
+            if config is not None:
+                return config
 
-        return cls(**data)
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+
+        if not validate:
+            return cls._construct(data)
+
+        config = cls(**data)
+        if use_cache:
+            config._save_cache(path, cache_path, data.get("stores", {}))
+        return config
+
+    @staticmethod
+    def _source_signature(path: Path) -> List[int]:
+        """Modification time (ns) and size of the source file."""
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
 
     @classmethod
-    def from_dict(cls, data: Dict) -> "Config":
+    def _load_cache(cls, path: Path, cache_path: Path) -> Optional["Config"]:
+        """Load cached configuration, or None if missing, stale or unreadable."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") != _CACHE_VERSION:
+                return None
+            if cached.get("source") != cls._source_signature(path):
+                return None
+            # Cached settings and hosts were validated when the cache was written
+            return cls._construct(cached)
+        except Exception:
+            return None
+
+    def _save_cache(self, path: Path, cache_path: Path, raw_stores: Dict[str, Any]) -> None:
+        """Write configuration cache (best effort)."""
+        try:
+            cached = {
+                "version": _CACHE_VERSION,
+                "source": self._source_signature(path),
+                "settings": self.settings.model_dump(),
+                "stores": raw_stores,
+                "hosts": [host.model_dump() for host in self.hosts],
+            }
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cached, f)
+        except OSError:
+            pass
+
+    @classmethod
+    def from_dict(cls, data: Dict, validate: bool = True) -> "Config":
         """Create configuration from dictionary."""
+        if not validate:
+            return cls._construct(data)
         return cls(**data)
 
+    @classmethod
+    def _construct(cls, data: Dict) -> "Config":
+        """
+        Build configuration from trusted data without validating it.
+
+        Settings and hosts skip validation; stores are still validated so
+        password environment variables are expanded.
+        """
+        return cls.model_construct(
+            settings=SettingsConfig.model_construct(**data.get("settings", {})),
+            stores=StoreConfig(**data.get("stores", {})),
+            hosts=[HostConfig.model_construct(**host) for host in data.get("hosts", [])],
+        )
+
+    # Host lookups are computed once; hosts are not modified after loading
+
+    @cached_property
+    def _enabled_hosts(self) -> Tuple[HostConfig, ...]:
+        return tuple(host for host in self.hosts if host.enabled)
+
+    @cached_property
+    def _hosts_by_name(self) -> Dict[str, HostConfig]:
+        # First entry wins for duplicate names
+        by_name: Dict[str, HostConfig] = {}
+        for host in self.hosts:
+            by_name.setdefault(host.name, host)
+        return by_name
+
     def get_enabled_hosts(self) -> List[HostConfig]:
         """Get list of enabled hosts."""
-        return [host for host in self.hosts if host.enabled]
+        return list(self._enabled_hosts)
 
     def get_host_by_name(self, name: str) -> Optional[HostConfig]:
         """Get host configuration by name."""
-        for host in self.hosts:
-            if host.name == name:
-                return host
-        return None
+        return self._hosts_by_name.get(name)
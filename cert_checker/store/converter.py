@@ -1,9 +1,14 @@
 """Certificate format converter."""
 
+import base64
+import binascii
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
+import jks
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
@@ -11,37 +16,82 @@ from cryptography.hazmat.primitives.serialization import pkcs12
 
 from cert_checker.utils.cert_parser import CertificateParser
 
+# (input_path, output_path, from_format, to_format, password)
+ConversionJob = Tuple[Path, Path, str, str, Optional[str]]
+
+_PEM_HEADER = b"-----BEGIN CERTIFICATE-----"
+_PEM_FOOTER = b"-----END CERTIFICATE-----"
+_PEM_LINE_LENGTH = 64
+
 
 class CertificateConverter:
     """Convert certificates between different formats."""
 
     @staticmethod
-    def pem_to_der(pem_data: str) -> bytes:
+    def pem_to_der(pem_data: Union[str, bytes], validate: bool = False) -> bytes:
         """
         Convert PEM to DER format.
 
+        PEM is base64-encoded DER, so the first certificate block is decoded
+        directly without parsing the certificate.
+
         Args:
-            pem_data: PEM-encoded certificate
+            pem_data: PEM-encoded certificate (text or raw bytes)
+            validate: Parse the certificate to check it is well-formed
 
         Returns:
             DER-encoded certificate bytes
+
+        Raises:
+            ValueError: If no valid PEM certificate block is found
         """
-        cert = CertificateParser.parse_pem(pem_data)
-        return CertificateParser.to_der(cert)
+        if validate:
+            cert = CertificateParser.parse_pem(pem_data)
+            return CertificateParser.to_der(cert)
+
+        if isinstance(pem_data, str):
+            pem_data = pem_data.encode("ascii", errors="replace")
+
+        start = pem_data.find(_PEM_HEADER)
+        end = pem_data.find(_PEM_FOOTER, start)
+        if start < 0 or end < 0:
+            raise ValueError("No PEM certificate found")
+
+        body = b"".join(pem_data[start + len(_PEM_HEADER) : end].split())
+        try:
+            return base64.b64decode(body, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid PEM certificate: {e}")
 
     @staticmethod
-    def der_to_pem(der_data: bytes) -> str:
+    def der_to_pem(der_data: bytes, validate: bool = False) -> str:
         """
         Convert DER to PEM format.
 
+        The DER bytes are base64-encoded directly without parsing the
+        certificate.
+
         Args:
             der_data: DER-encoded certificate
+            validate: Parse the certificate to check it is well-formed
 
         Returns:
             PEM-encoded certificate string
+
+        Raises:
+            ValueError: If the data is not a DER structure
         """
-        cert = CertificateParser.parse_der(der_data)
-        return CertificateParser.to_pem(cert)
+        if validate:
+            cert = CertificateParser.parse_der(der_data)
+            return CertificateParser.to_pem(cert)
+
+        # A certificate is an ASN.1 SEQUENCE
+        if not der_data or der_data[0] != 0x30:
+            raise ValueError("Invalid DER certificate")
+
+        b64 = base64.b64encode(der_data).decode("ascii")
+        lines = [b64[i : i + _PEM_LINE_LENGTH] for i in range(0, len(b64), _PEM_LINE_LENGTH)]
+        return "-----BEGIN CERTIFICATE-----\n" + "\n".join(lines) + "\n-----END CERTIFICATE-----\n"
 
     @staticmethod
     def pkcs12_to_pem(
@@ -57,8 +107,7 @@ class CertificateConverter:
         Returns:
             Tuple of (private_key, certificate, ca_certificates)
         """
-        with open(p12_path, "rb") as f:
-            p12_data = f.read()
+        p12_data = Path(p12_path).read_bytes()
 
         private_key, certificate, ca_certs = pkcs12.load_key_and_certificates(
             p12_data, password, default_backend()
@@ -83,31 +132,24 @@ class CertificateConverter:
             cert_path: Path to certificate PEM file
             output_path: Output PKCS12 file path
             password: PKCS12 password
-            ca_certs_paths: List of CA certificate PEM files
+            ca_certs_paths: List of CA certificate PEM files (single or bundle)
             friendly_name: Friendly name for the entry
         """
         # Load certificate
-        with open(cert_path, "rb") as f:
-            cert_data = f.read()
-        cert = x509.load_pem_x509_certificate(cert_data, default_backend())
+        cert = x509.load_pem_x509_certificate(Path(cert_path).read_bytes(), default_backend())
 
         # Load private key if provided
         private_key = None
         if key_path:
-            with open(key_path, "rb") as f:
-                key_data = f.read()
             private_key = serialization.load_pem_private_key(
-                key_data, password=None, backend=default_backend()
+                Path(key_path).read_bytes(), password=None, backend=default_backend()
             )
 
-        # Load CA certificates if provided
+        # Load CA certificates if provided (files may be PEM bundles)
         ca_certs = []
         if ca_certs_paths:
-            for ca_path in ca_certs_paths:
-                with open(ca_path, "rb") as f:
-                    ca_data = f.read()
-                ca_cert = x509.load_pem_x509_certificate(ca_data, default_backend())
-                ca_certs.append(ca_cert)
+            ca_data = b"\n".join(Path(ca_path).read_bytes() for ca_path in ca_certs_paths)
+            ca_certs = CertificateParser.parse_pem_many(ca_data)
 
         # Create PKCS12
         p12_data = pkcs12.serialize_key_and_certificates(
@@ -119,8 +161,7 @@ class CertificateConverter:
         )
 
         # Write PKCS12 file
-        with open(output_path, "wb") as f:
-            f.write(p12_data)
+        Path(output_path).write_bytes(p12_data)
 
     @staticmethod
     def jks_to_pkcs12(
@@ -130,9 +171,14 @@ class CertificateConverter:
         alias: Optional[str] = None,
     ) -> bool:
         """
-        Convert JKS to PKCS12 using keytool.
+        Convert JKS to PKCS12.
 
-        Note: Requires Java keytool to be installed.
+        Keystores holding a single private key entry are converted in-process
+        with pyjks; anything else (trusted certificates, several keys, keys
+        with their own password, stores pyjks cannot read such as PKCS12
+        files named .jks) falls back to keytool.
+
+        Note: The keytool fallback requires Java keytool to be installed.
 
         Args:
             jks_path: Path to JKS file
@@ -145,8 +191,11 @@ class CertificateConverter:
 
         Raises:
             FileNotFoundError: If keytool is not found
-            subprocess.CalledProcessError: If conversion fails
+            RuntimeError: If conversion fails
         """
+        if CertificateConverter._jks_to_pkcs12_native(jks_path, pkcs12_path, password, alias):
+            return True
+
         cmd = [
             "keytool",
             "-importkeystore",
@@ -187,9 +236,13 @@ class CertificateConverter:
         alias: Optional[str] = None,
     ) -> bool:
         """
-        Convert PKCS12 to JKS using keytool.
+        Convert PKCS12 to JKS.
+
+        A PKCS12 file holding only a key and its issuer chain is converted
+        in-process with pyjks; other files (e.g. with unrelated trusted CA
+        certificates) fall back to keytool.
 
-        Note: Requires Java keytool to be installed.
+        Note: The keytool fallback requires Java keytool to be installed.
 
         Args:
             pkcs12_path: Path to PKCS12 file
@@ -202,8 +255,11 @@ class CertificateConverter:
 
         Raises:
             FileNotFoundError: If keytool is not found
-            subprocess.CalledProcessError: If conversion fails
+            RuntimeError: If conversion fails
         """
+        if CertificateConverter._pkcs12_to_jks_native(pkcs12_path, jks_path, password, alias):
+            return True
+
         cmd = [
             "keytool",
             "-importkeystore",
@@ -236,6 +292,131 @@ class CertificateConverter:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Conversion failed: {e.stderr}")
 
+    @staticmethod
+    def _jks_to_pkcs12_native(
+        jks_path: Path, pkcs12_path: Path, password: str, alias: Optional[str]
+    ) -> bool:
+        """
+        Convert a single-key JKS to PKCS12 with pyjks.
+
+        Returns:
+            True if converted, False if the keystore needs keytool
+        """
+        try:
+            keystore = jks.KeyStore.load(str(jks_path), password)
+        except jks.util.KeystoreSignatureException as e:
+            raise RuntimeError(f"Conversion failed: {e}")
+        except Exception:
+            # Not a store pyjks can read (e.g. PKCS12 named .jks); keytool handles it
+            return False
+
+        if alias:
+            entry = keystore.private_keys.get(alias)
+        elif len(keystore.private_keys) == 1 and not keystore.certs:
+            alias, entry = next(iter(keystore.private_keys.items()))
+        else:
+            return False
+
+        # Keys protected by a different password stay encrypted on load
+        if entry is None or not entry.is_decrypted() or not entry.cert_chain:
+            return False
+
+        try:
+            private_key = serialization.load_der_private_key(
+                entry.pkey_pkcs8, password=None, backend=default_backend()
+            )
+            cert_chain = CertificateParser.parse_der_many(der for _, der in entry.cert_chain)
+            p12_data = pkcs12.serialize_key_and_certificates(
+                name=alias.encode("utf-8"),
+                key=private_key,
+                cert=cert_chain[0],
+                cas=cert_chain[1:] or None,
+                encryption_algorithm=serialization.BestAvailableEncryption(
+                    password.encode("utf-8")
+                ),
+            )
+        except Exception as e:
+            raise RuntimeError(f"Conversion failed: {e}")
+
+        Path(pkcs12_path).write_bytes(p12_data)
+        return True
+
+    @staticmethod
+    def _pkcs12_to_jks_native(
+        pkcs12_path: Path, jks_path: Path, password: str, alias: Optional[str]
+    ) -> bool:
+        """
+        Convert a key-and-chain PKCS12 to JKS with pyjks.
+
+        Returns:
+            True if converted, False if the file needs keytool
+        """
+        try:
+            p12 = pkcs12.load_pkcs12(
+                Path(pkcs12_path).read_bytes(), password.encode("utf-8"), default_backend()
+            )
+        except Exception as e:
+            raise RuntimeError(f"Conversion failed: {e}")
+
+        if p12.key is None or p12.cert is None:
+            return False
+
+        friendly_name = p12.cert.friendly_name
+        entry_alias = friendly_name.decode("utf-8") if friendly_name else "1"
+        if alias and alias != entry_alias:
+            return False
+
+        # Other certificates are kept only as the key's chain; trusted entries need keytool
+        cert_chain = CertificateConverter._issuer_chain(
+            p12.cert.certificate, [ca.certificate for ca in p12.additional_certs]
+        )
+        if cert_chain is None:
+            return False
+
+        try:
+            pkey_pkcs8 = p12.key.private_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+            entry = jks.PrivateKeyEntry.new(
+                entry_alias,
+                [CertificateParser.to_der(cert) for cert in cert_chain],
+                pkey_pkcs8,
+            )
+            keystore = jks.KeyStore.new("jks", [entry])
+            keystore.save(str(jks_path), password)
+        except Exception as e:
+            raise RuntimeError(f"Conversion failed: {e}")
+
+        return True
+
+    @staticmethod
+    def _issuer_chain(
+        leaf: x509.Certificate, others: List[x509.Certificate]
+    ) -> Optional[List[x509.Certificate]]:
+        """
+        Order certificates as the issuer chain of a leaf.
+
+        Returns:
+            Leaf followed by its issuers, or None if any certificate is not
+            part of the chain
+        """
+        chain = [leaf]
+        remaining = list(others)
+        while remaining:
+            issuer = chain[-1].issuer
+            if issuer == chain[-1].subject:
+                # Self-signed root reached with certificates left over
+                return None
+            for i, cert in enumerate(remaining):
+                if cert.subject == issuer:
+                    chain.append(remaining.pop(i))
+                    break
+            else:
+                return None
+        return chain
+
     @staticmethod
     def convert(
         input_path: Path,
@@ -265,20 +446,15 @@ class CertificateConverter:
 
         # PEM to DER
         if from_format == "pem" and to_format == "der":
-            with open(input_path, "r") as f:
-                pem_data = f.read()
-            der_data = CertificateConverter.pem_to_der(pem_data)
-            with open(output_path, "wb") as f:
-                f.write(der_data)
+            # PEM is ASCII; parse the raw bytes without decoding to str
+            der_data = CertificateConverter.pem_to_der(Path(input_path).read_bytes())
+            Path(output_path).write_bytes(der_data)
             return True
 
         # DER to PEM
         elif from_format == "der" and to_format == "pem":
-            with open(input_path, "rb") as f:
-                der_data = f.read()
-            pem_data = CertificateConverter.der_to_pem(der_data)
-            with open(output_path, "w") as f:
-                f.write(pem_data)
+            pem_data = CertificateConverter.der_to_pem(Path(input_path).read_bytes())
+            Path(output_path).write_text(pem_data)
             return True
 
         # JKS to PKCS12
@@ -301,3 +477,32 @@ class CertificateConverter:
             raise ValueError(
                 f"Conversion from {from_format} to {to_format} not supported"
             )
+
+    @staticmethod
+    def convert_many(
+        jobs: Iterable[ConversionJob], max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """
+        Run several conversions concurrently.
+
+        JKS conversions each start a keytool JVM; running them side by side
+        hides the JVM startup time instead of paying it once per file.
+
+        Args:
+            jobs: Conversions as (input_path, output_path, from_format, to_format, password)
+            max_workers: Maximum concurrent conversions (defaults to CPU count)
+
+        Returns:
+            Result of each conversion, in job order
+
+        Raises:
+            Exception: The first failed conversion's error, after all jobs finish
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(CertificateConverter.convert, *job) for job in jobs]
+        return [future.result() for future in futures]
@@ -1,27 +1,99 @@
 """Keystore management for private keys and certificates."""
 
-import subprocess
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import jks
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from cryptography.hazmat.primitives.serialization import pkcs12
 
 from cert_checker.utils.cert_parser import CertificateParser
 
 
-@dataclass
+@dataclass(init=False)
 class KeyEntry:
-    """Key entry in keystore."""
+    """
+    Key entry in keystore.
+
+    Entries can be created from a DER certificate chain; the chain is then
+    parsed on first access. The subject CN is computed once, or taken from
+    the caller when it is already known. Entries compare by alias, key
+    presence and DER-encoded chain, however they were created.
+    """
 
     alias: str
-    certificate: x509.Certificate
-    certificate_chain: List[x509.Certificate]
-    has_private_key: bool = True
+    has_private_key: bool
+    _chain: Optional[List[x509.Certificate]] = field(repr=False, compare=False)
+    _chain_der: Optional[List[bytes]] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        alias: str,
+        certificate: Optional[x509.Certificate] = None,
+        certificate_chain: Optional[List[x509.Certificate]] = None,
+        has_private_key: bool = True,
+        chain_der: Optional[List[bytes]] = None,
+        subject_cn: Optional[str] = None,
+    ):
+        if certificate_chain is None and certificate is not None:
+            certificate_chain = [certificate]
+        if not certificate_chain and not chain_der:
+            raise ValueError("Either a certificate chain or chain_der is required")
+        self.alias = alias
+        self.has_private_key = has_private_key
+        self._chain = certificate_chain
+        self._chain_der = chain_der
+        if subject_cn is not None:
+            self.subject_cn = subject_cn
+
+    @property
+    def certificate_chain(self) -> List[x509.Certificate]:
+        """Certificate chain, leaf first (parsed from DER on first access)."""
+        if self._chain is None:
+            chain_der = self._chain_der
+            # __init__ requires a chain or chain_der
+            assert chain_der is not None
+            self._chain = CertificateParser.parse_der_many(chain_der)
+        return self._chain
+
+    @property
+    def certificate(self) -> x509.Certificate:
+        """Entry certificate (first in chain)."""
+        return self.certificate_chain[0]
+
+    @property
+    def certificate_chain_der(self) -> List[bytes]:
+        """DER-encoded certificate chain, leaf first."""
+        if self._chain_der is None:
+            chain = self._chain
+            assert chain is not None
+            self._chain_der = [CertificateParser.to_der(cert) for cert in chain]
+        return self._chain_der
+
+    @cached_property
+    def subject_cn(self) -> Optional[str]:
+        """Subject common name of the entry certificate."""
+        return CertificateParser.get_subject_cn(self.certificate)
+
+    @cached_property
+    def fingerprint(self) -> bytes:
+        """SHA-256 digest of the DER-encoded entry certificate."""
+        return hashlib.sha256(self.certificate_chain_der[0]).digest()
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.alias, self.has_private_key, self.certificate_chain_der) == (
+            other.alias,
+            other.has_private_key,
+            other.certificate_chain_der,
+        )
 
 
 class KeystoreManager:
@@ -46,10 +118,24 @@ class KeystoreManager:
         self.format = format.lower()
         self.entries: Dict[str, KeyEntry] = {}
         self._private_keys: Dict[str, bytes] = {}
+        # Decoded private keys, filled at load/add time or on first use
+        self._private_key_objs: Dict[str, PrivateKeyTypes] = {}
+        # Aliases by SHA-256 certificate fingerprint, built on first lookup
+        self._fingerprint_index: Optional[Dict[bytes, str]] = None
+        # Snapshot returned by list_entries
+        self._entries_view: Optional[Tuple[KeyEntry, ...]] = None
+        # First alias in insertion order, the one written to PKCS12
+        self._primary_alias: Optional[str] = None
 
         if path and path.exists():
             self.load()
 
+    def _entries_changed(self) -> None:
+        """Drop lookups derived from entries after they change."""
+        self._fingerprint_index = None
+        self._entries_view = None
+        self._primary_alias = next(iter(self.entries), None)
+
     def load(self, path: Optional[Path] = None, password: Optional[str] = None) -> None:
         """
         Load keystore from file.
@@ -67,12 +153,15 @@ class KeystoreManager:
         self.path = path
         self.password = password
 
-        if self.format == "jks":
-            self._load_jks(path, password)
-        elif self.format == "pkcs12":
-            self._load_pkcs12(path, password)
-        else:
-            raise ValueError(f"Unsupported format: {self.format}")
+        try:
+            if self.format == "jks":
+                self._load_jks(path, password)
+            elif self.format == "pkcs12":
+                self._load_pkcs12(path, password)
+            else:
+                raise ValueError(f"Unsupported format: {self.format}")
+        finally:
+            self._entries_changed()
 
     def _load_jks(self, path: Path, password: Optional[str]) -> None:
         """Load JKS keystore."""
@@ -81,19 +170,14 @@ class KeystoreManager:
         try:
             keystore = jks.KeyStore.load(str(path), pwd)
 
-            # Load private key entries
+            # Load private key entries (chains are parsed when first accessed)
             for alias, entry in keystore.private_keys.items():
-                # Get certificate chain
-                cert_chain = []
-                for cert_data in entry.cert_chain:
-                    cert = x509.load_der_x509_certificate(cert_data[1], default_backend())
-                    cert_chain.append(cert)
+                chain_der = [cert_data[1] for cert_data in entry.cert_chain]
 
-                if cert_chain:
+                if chain_der:
                     self.entries[alias] = KeyEntry(
                         alias=alias,
-                        certificate=cert_chain[0],
-                        certificate_chain=cert_chain,
+                        chain_der=chain_der,
                         has_private_key=True,
                     )
 
@@ -108,8 +192,7 @@ class KeystoreManager:
         pwd = password.encode("utf-8") if password else None
 
         try:
-            with open(path, "rb") as f:
-                p12_data = f.read()
+            p12_data = path.read_bytes()
 
             private_key, certificate, ca_certs = pkcs12.load_key_and_certificates(
                 p12_data, pwd, default_backend()
@@ -121,13 +204,15 @@ class KeystoreManager:
                 if ca_certs:
                     cert_chain.extend(ca_certs)
 
-                alias = CertificateParser.get_subject_cn(certificate) or "key"
+                subject_cn = CertificateParser.get_subject_cn(certificate)
+                alias = subject_cn or "key"
 
                 self.entries[alias] = KeyEntry(
                     alias=alias,
                     certificate=certificate,
                     certificate_chain=cert_chain,
                     has_private_key=True,
+                    subject_cn=subject_cn,
                 )
 
                 # Store private key in PEM format
@@ -137,18 +222,25 @@ class KeystoreManager:
                     encryption_algorithm=serialization.NoEncryption(),
                 )
                 self._private_keys[alias] = pkey_pem
+                self._private_key_objs[alias] = private_key
 
         except Exception as e:
             raise RuntimeError(f"Failed to load PKCS12 keystore: {e}")
 
-    def list_entries(self) -> List[KeyEntry]:
+    def list_entries(self) -> Tuple[KeyEntry, ...]:
         """
         List all key entries in keystore.
 
         Returns:
-            List of key entries
+            Key entries (cached until the keystore changes)
         """
-        return list(self.entries.values())
+        if self._entries_view is None:
+            self._entries_view = tuple(self.entries.values())
+        return self._entries_view
+
+    def iter_entries(self) -> Iterator[KeyEntry]:
+        """Iterate over key entries without building a sequence."""
+        return iter(self.entries.values())
 
     def get_certificate(self, alias: str) -> Optional[x509.Certificate]:
         """
@@ -188,6 +280,53 @@ class KeystoreManager:
         """
         return alias in self._private_keys
 
+    def get_by_fingerprint(self, fingerprint: bytes) -> Optional[KeyEntry]:
+        """
+        Get entry by certificate fingerprint.
+
+        Args:
+            fingerprint: SHA-256 digest of the DER-encoded entry certificate
+
+        Returns:
+            Key entry or None if not found
+        """
+        if self._fingerprint_index is None:
+            index: Dict[bytes, str] = {}
+            for alias, entry in self.entries.items():
+                index.setdefault(entry.fingerprint, alias)
+            self._fingerprint_index = index
+        found = self._fingerprint_index.get(fingerprint)
+        return self.entries[found] if found is not None else None
+
+    def _get_private_key(self, alias: str) -> PrivateKeyTypes:
+        """Get decoded private key for alias, decoding it once."""
+        private_key = self._private_key_objs.get(alias)
+        if private_key is None:
+            key_data = self._private_keys[alias]
+            # PKCS12 and added keys are stored as PEM, JKS keys as DER PKCS#8
+            if key_data.startswith(b"-----"):
+                private_key = serialization.load_pem_private_key(
+                    key_data, password=None, backend=default_backend()
+                )
+            else:
+                private_key = serialization.load_der_private_key(
+                    key_data, password=None, backend=default_backend()
+                )
+            self._private_key_objs[alias] = private_key
+        return private_key
+
+    def _get_private_key_pkcs8(self, alias: str) -> bytes:
+        """Get unencrypted DER PKCS#8 private key for alias."""
+        key_data = self._private_keys[alias]
+        if not key_data.startswith(b"-----"):
+            # JKS keys are already stored as DER PKCS#8
+            return key_data
+        return self._get_private_key(alias).private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+
     def add_key_entry(
         self,
         alias: str,
@@ -204,7 +343,7 @@ class KeystoreManager:
             alias: Entry alias
             private_key_path: Path to private key file
             cert_path: Path to certificate file
-            chain_paths: Paths to chain certificates
+            chain_paths: Paths to chain certificates (single or bundle)
             key_password: Private key password
             overwrite: Whether to overwrite existing entry
 
@@ -215,8 +354,7 @@ class KeystoreManager:
             raise ValueError(f"Alias '{alias}' already exists")
 
         # Load private key
-        with open(private_key_path, "rb") as f:
-            key_data = f.read()
+        key_data = Path(private_key_path).read_bytes()
 
         key_pwd = key_password.encode("utf-8") if key_password else None
         private_key = serialization.load_pem_private_key(
@@ -224,18 +362,15 @@ class KeystoreManager:
         )
 
         # Load certificate
-        with open(cert_path, "rb") as f:
-            cert_data = f.read()
-        certificate = CertificateParser.parse_pem(cert_data.decode("utf-8"))
+        certificate = x509.load_pem_x509_certificate(
+            Path(cert_path).read_bytes(), default_backend()
+        )
 
-        # Load chain certificates
+        # Load chain certificates in one parse (files may be PEM bundles)
         cert_chain = [certificate]
         if chain_paths:
-            for chain_path in chain_paths:
-                with open(chain_path, "rb") as f:
-                    chain_data = f.read()
-                chain_cert = CertificateParser.parse_pem(chain_data.decode("utf-8"))
-                cert_chain.append(chain_cert)
+            chain_data = b"\n".join(Path(chain_path).read_bytes() for chain_path in chain_paths)
+            cert_chain.extend(CertificateParser.parse_pem_many(chain_data))
 
         # Store entry
         self.entries[alias] = KeyEntry(
@@ -252,6 +387,8 @@ class KeystoreManager:
             encryption_algorithm=serialization.NoEncryption(),
         )
         self._private_keys[alias] = pkey_pem
+        self._private_key_objs[alias] = private_key
+        self._entries_changed()
 
         return True
 
@@ -267,8 +404,9 @@ class KeystoreManager:
         """
         if alias in self.entries:
             del self.entries[alias]
-            if alias in self._private_keys:
-                del self._private_keys[alias]
+            self._private_keys.pop(alias, None)
+            self._private_key_objs.pop(alias, None)
+            self._entries_changed()
             return True
         return False
 
@@ -297,16 +435,11 @@ class KeystoreManager:
         format = format.lower()
 
         if format == "pkcs12":
-            # Load private key
-            private_key = serialization.load_pem_private_key(
-                self._private_keys[alias], password=None, backend=default_backend()
-            )
-
             # Create PKCS12
             pwd = password.encode("utf-8") if password else b"changeit"
             p12_data = pkcs12.serialize_key_and_certificates(
                 name=alias.encode("utf-8"),
-                key=private_key,
+                key=self._get_private_key(alias),
                 cert=entry.certificate,
                 cas=entry.certificate_chain[1:] if len(entry.certificate_chain) > 1 else None,
                 encryption_algorithm=serialization.BestAvailableEncryption(pwd),
@@ -332,9 +465,10 @@ class KeystoreManager:
             # Chain
             if len(entry.certificate_chain) > 1:
                 chain_path = Path(f"{base_path}_chain.pem")
-                with open(chain_path, "w") as f:
-                    for cert in entry.certificate_chain[1:]:
-                        f.write(CertificateParser.to_pem(cert))
+                chain_pem = "".join(
+                    CertificateParser.to_pem(cert) for cert in entry.certificate_chain[1:]
+                )
+                chain_path.write_text(chain_pem)
 
         else:
             raise ValueError(f"Unsupported export format: {format}")
@@ -367,28 +501,21 @@ class KeystoreManager:
 
     def _save_pkcs12(self, path: Path, password: Optional[str]) -> bool:
         """Save as PKCS12 keystore."""
-        if not self.entries:
+        # First entry (PKCS12 typically holds one key)
+        alias = self._primary_alias
+        if alias is None:
             raise ValueError("No entries to save")
-
-        # Get first entry (PKCS12 typically holds one key)
-        alias = next(iter(self.entries))
-        entry = self.entries[alias]
-
         if alias not in self._private_keys:
             raise ValueError("No private key found")
-
-        # Load private key
-        private_key = serialization.load_pem_private_key(
-            self._private_keys[alias], password=None, backend=default_backend()
-        )
+        chain = self.entries[alias].certificate_chain
 
         # Create PKCS12
         pwd = password.encode("utf-8") if password else b"changeit"
         p12_data = pkcs12.serialize_key_and_certificates(
             name=alias.encode("utf-8"),
-            key=private_key,
-            cert=entry.certificate,
-            cas=entry.certificate_chain[1:] if len(entry.certificate_chain) > 1 else None,
+            key=self._get_private_key(alias),
+            cert=chain[0],
+            cas=chain[1:] if len(chain) > 1 else None,
             encryption_algorithm=serialization.BestAvailableEncryption(pwd),
         )
 
@@ -398,35 +525,22 @@ class KeystoreManager:
         return True
 
     def _save_jks(self, path: Path, password: Optional[str]) -> bool:
-        """Save as JKS keystore using keytool."""
-        # Export to PKCS12 first, then convert
-        temp_p12 = Path("/tmp/temp_keystore.p12")
-        self._save_pkcs12(temp_p12, password)
-
+        """Save as JKS keystore."""
         pwd = password or "changeit"
 
-        try:
-            cmd = [
-                "keytool",
-                "-importkeystore",
-                "-srckeystore",
-                str(temp_p12),
-                "-destkeystore",
-                str(path),
-                "-srcstoretype",
-                "PKCS12",
-                "-deststoretype",
-                "JKS",
-                "-srcstorepass",
-                pwd,
-                "-deststorepass",
-                pwd,
-                "-noprompt",
-            ]
-
-            subprocess.run(cmd, check=True, capture_output=True)
-            return True
+        jks_entries = []
+        for alias, entry in self.entries.items():
+            if alias not in self._private_keys:
+                continue
+            jks_entries.append(
+                jks.PrivateKeyEntry.new(
+                    alias, entry.certificate_chain_der, self._get_private_key_pkcs8(alias)
+                )
+            )
 
-        finally:
-            if temp_p12.exists():
-                temp_p12.unlink()
+        if not jks_entries:
+            raise ValueError("No private key found")
+
+        keystore = jks.KeyStore.new("jks", jks_entries)
+        keystore.save(str(path), pwd)
+        return True
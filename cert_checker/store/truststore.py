@@ -1,31 +1,117 @@
 """Truststore management for various formats."""
 
+import hashlib
 import os
-import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import jks
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.serialization import pkcs12
 
 from cert_checker.utils.cert_parser import CertificateParser
 
+# Maximum threads for reading and writing PEM directories
+MAX_PEM_WORKERS = 32
 
-@dataclass
+
+def _read_pem_file(pem_file: Path) -> Tuple[str, x509.Certificate]:
+    """Read and parse a PEM certificate file, returning (alias, certificate)."""
+    return pem_file.stem, CertificateParser.parse_pem(pem_file.read_bytes())
+
+
+def _pem_dir_signature(path: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Return (name, mtime_ns, size) for each .crt file in a directory, sorted by name."""
+    signature = []
+    with os.scandir(path) as it:
+        for dir_entry in it:
+            if dir_entry.name.endswith(".crt") and dir_entry.is_file():
+                st = dir_entry.stat()
+                signature.append((dir_entry.name, st.st_mtime_ns, st.st_size))
+    signature.sort()
+    return tuple(signature)
+
+
+@dataclass(init=False)
 class CertificateEntry:
-    """Certificate entry in truststore."""
+    """
+    Certificate entry in truststore.
+
+    Entries can be created from DER bytes instead of a certificate; the
+    certificate is then parsed on first access. The subject CN is computed
+    once, or taken from the caller when it is already known. Entries
+    compare by alias, type and DER encoding, however they were created.
+    """
 
     alias: str
-    certificate: x509.Certificate
-    entry_type: str = "trusted_cert"
+    entry_type: str
+    _certificate: Optional[x509.Certificate] = field(repr=False, compare=False)
+    _der: Optional[bytes] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        alias: str,
+        certificate: Optional[x509.Certificate] = None,
+        entry_type: str = "trusted_cert",
+        der: Optional[bytes] = None,
+        subject_cn: Optional[str] = None,
+    ):
+        if certificate is None and der is None:
+            raise ValueError("Either certificate or der is required")
+        self.alias = alias
+        self.entry_type = entry_type
+        self._certificate = certificate
+        self._der = der
+        if subject_cn is not None:
+            self.subject_cn = subject_cn
+
+    @cached_property
+    def subject_cn(self) -> Optional[str]:
+        """Subject common name."""
+        return CertificateParser.get_subject_cn(self.certificate)
+
+    @property
+    def certificate(self) -> x509.Certificate:
+        """Certificate (parsed from DER on first access)."""
+        if self._certificate is None:
+            der = self._der
+            # __init__ requires a certificate or DER
+            assert der is not None
+            self._certificate = CertificateParser.parse_der(der)
+        return self._certificate
+
+    @property
+    def der(self) -> bytes:
+        """DER-encoded certificate."""
+        if self._der is None:
+            certificate = self._certificate
+            assert certificate is not None
+            self._der = CertificateParser.to_der(certificate)
+        return self._der
+
+    @cached_property
+    def fingerprint(self) -> bytes:
+        """SHA-256 digest of the DER-encoded certificate."""
+        return hashlib.sha256(self.der).digest()
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.alias, self.entry_type, self.der) == (other.alias, other.entry_type, other.der)
 
 
 class TruststoreManager:
     """Manage truststore in various formats."""
 
+    # Parsed PEM directories keyed by resolved path, with the file signature
+    # they were loaded from; shared by all managers in the process
+    _pem_dir_cache: Dict[Path, Tuple[Tuple, Dict[str, CertificateEntry]]] = {}
+
     def __init__(
         self, path: Optional[Path] = None, password: Optional[str] = None, format: str = "jks"
     ):
@@ -42,9 +128,22 @@ class TruststoreManager:
         self.format = format.lower()
         self.entries: Dict[str, CertificateEntry] = {}
 
+        # Certificates by DER-encoded subject and aliases by SHA-256
+        # fingerprint, built on first lookup
+        self._subject_index: Optional[Dict[bytes, List[x509.Certificate]]] = None
+        self._fingerprint_index: Optional[Dict[bytes, str]] = None
+        # Snapshot returned by list_certificates
+        self._entries_view: Optional[Tuple[CertificateEntry, ...]] = None
+
         if path and path.exists():
             self.load()
 
+    def _entries_changed(self) -> None:
+        """Drop lookups derived from entries after they change."""
+        self._subject_index = None
+        self._fingerprint_index = None
+        self._entries_view = None
+
     def load(self, path: Optional[Path] = None, password: Optional[str] = None) -> None:
         """
         Load truststore from file.
@@ -61,6 +160,7 @@ class TruststoreManager:
 
         self.path = path
         self.password = password
+        self._entries_changed()
 
         if self.format == "jks":
             self._load_jks(path, password)
@@ -79,10 +179,10 @@ class TruststoreManager:
         try:
             keystore = jks.KeyStore.load(str(path), pwd)
 
-            for alias, entry in keystore.certs.items():
-                cert = x509.load_der_x509_certificate(entry.cert, default_backend())
+            # Certificates are parsed when first accessed
+            for alias, trusted_cert in keystore.certs.items():
                 self.entries[alias] = CertificateEntry(
-                    alias=alias, certificate=cert, entry_type="trusted_cert"
+                    alias=alias, der=trusted_cert.cert, entry_type="trusted_cert"
                 )
 
         except Exception as e:
@@ -93,8 +193,7 @@ class TruststoreManager:
         pwd = password.encode("utf-8") if password else None
 
         try:
-            with open(path, "rb") as f:
-                p12_data = f.read()
+            p12_data = path.read_bytes()
 
             private_key, certificate, ca_certs = pkcs12.load_key_and_certificates(
                 p12_data, pwd, default_backend()
@@ -102,50 +201,75 @@ class TruststoreManager:
 
             # Add main certificate
             if certificate:
-                alias = CertificateParser.get_subject_cn(certificate) or "certificate"
+                subject_cn = CertificateParser.get_subject_cn(certificate)
+                alias = subject_cn or "certificate"
                 self.entries[alias] = CertificateEntry(
-                    alias=alias, certificate=certificate
+                    alias=alias, certificate=certificate, subject_cn=subject_cn
                 )
 
             # Add CA certificates
             if ca_certs:
                 for i, ca_cert in enumerate(ca_certs):
-                    alias = CertificateParser.get_subject_cn(ca_cert) or f"ca_cert_{i}"
+                    subject_cn = CertificateParser.get_subject_cn(ca_cert)
+                    alias = subject_cn or f"ca_cert_{i}"
                     self.entries[alias] = CertificateEntry(
-                        alias=alias, certificate=ca_cert
+                        alias=alias, certificate=ca_cert, subject_cn=subject_cn
                     )
 
         except Exception as e:
             raise RuntimeError(f"Failed to load PKCS12 truststore: {e}")
 
     def _load_pem_dir(self, path: Path) -> None:
-        """Load PEM certificates from directory."""
+        """Load PEM certificates from a directory or a single (bundle) file."""
         if path.is_file():
-            # Single PEM file
-            with open(path, "r") as f:
-                pem_data = f.read()
-            cert = CertificateParser.parse_pem(pem_data)
-            alias = CertificateParser.get_subject_cn(cert) or path.stem
-            self.entries[alias] = CertificateEntry(alias=alias, certificate=cert)
+            # Single PEM file, possibly a concatenated CA bundle
+            for cert in CertificateParser.parse_pem_many(path.read_bytes()):
+                subject_cn = CertificateParser.get_subject_cn(cert)
+                alias = base_alias = subject_cn or path.stem
+                # Bundles can repeat a CN or omit it; keep every certificate
+                suffix = 2
+                while alias in self.entries:
+                    alias = f"{base_alias}-{suffix}"
+                    suffix += 1
+                self.entries[alias] = CertificateEntry(
+                    alias=alias, certificate=cert, subject_cn=subject_cn
+                )
         elif path.is_dir():
-            # Directory of PEM files
-            for pem_file in path.glob("*.crt"):
-                with open(pem_file, "r") as f:
-                    pem_data = f.read()
-                cert = CertificateParser.parse_pem(pem_data)
-                alias = pem_file.stem
-                self.entries[alias] = CertificateEntry(alias=alias, certificate=cert)
+            # Reuse the last load while no .crt file was added, removed or modified
+            cache_key = path.resolve()
+            signature = _pem_dir_signature(path)
+            cached = self._pem_dir_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                self.entries.update(cached[1])
+                return
+
+            # Directory of PEM files, read and parsed concurrently
+            pem_files = [path / name for name, _, _ in signature]
+            loaded: Dict[str, CertificateEntry] = {}
+            if pem_files:
+                workers = min(MAX_PEM_WORKERS, len(pem_files))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for alias, cert in executor.map(_read_pem_file, pem_files):
+                        loaded[alias] = CertificateEntry(alias=alias, certificate=cert)
+            self._pem_dir_cache[cache_key] = (signature, loaded)
+            self.entries.update(loaded)
         else:
             raise ValueError(f"Invalid PEM path: {path}")
 
-    def list_certificates(self) -> List[CertificateEntry]:
+    def list_certificates(self) -> Tuple[CertificateEntry, ...]:
         """
         List all certificates in truststore.
 
         Returns:
-            List of certificate entries
+            Certificate entries (cached until the truststore changes)
         """
-        return list(self.entries.values())
+        if self._entries_view is None:
+            self._entries_view = tuple(self.entries.values())
+        return self._entries_view
+
+    def iter_certificates(self) -> Iterator[CertificateEntry]:
+        """Iterate over certificate entries without building a sequence."""
+        return iter(self.entries.values())
 
     def get_certificate(self, alias: str) -> Optional[x509.Certificate]:
         """
@@ -160,6 +284,42 @@ class TruststoreManager:
         entry = self.entries.get(alias)
         return entry.certificate if entry else None
 
+    def find_by_subject(self, subject: x509.Name) -> List[x509.Certificate]:
+        """
+        Find trusted certificates with the given subject name.
+
+        Args:
+            subject: Subject name to look up
+
+        Returns:
+            Matching certificates (empty if none)
+        """
+        if self._subject_index is None:
+            index: Dict[bytes, List[x509.Certificate]] = {}
+            for entry in self.entries.values():
+                cert = entry.certificate
+                index.setdefault(cert.subject.public_bytes(), []).append(cert)
+            self._subject_index = index
+        return self._subject_index.get(subject.public_bytes(), [])
+
+    def get_by_fingerprint(self, fingerprint: bytes) -> Optional[CertificateEntry]:
+        """
+        Get entry by certificate fingerprint.
+
+        Args:
+            fingerprint: SHA-256 digest of the DER-encoded certificate
+
+        Returns:
+            Certificate entry or None if not found
+        """
+        if self._fingerprint_index is None:
+            index: Dict[bytes, str] = {}
+            for alias, entry in self.entries.items():
+                index.setdefault(entry.fingerprint, alias)
+            self._fingerprint_index = index
+        found = self._fingerprint_index.get(fingerprint)
+        return self.entries[found] if found is not None else None
+
     def add_certificate(
         self, cert: x509.Certificate, alias: str, overwrite: bool = False
     ) -> bool:
@@ -181,6 +341,7 @@ class TruststoreManager:
             raise ValueError(f"Alias '{alias}' already exists")
 
         self.entries[alias] = CertificateEntry(alias=alias, certificate=cert)
+        self._entries_changed()
         return True
 
     def remove_certificate(self, alias: str) -> bool:
@@ -195,6 +356,7 @@ class TruststoreManager:
         """
         if alias in self.entries:
             del self.entries[alias]
+            self._entries_changed()
             return True
         return False
 
@@ -222,9 +384,7 @@ class TruststoreManager:
         format = format.lower()
 
         if format == "pem":
-            pem_data = CertificateParser.to_pem(cert)
-            with open(output_path, "w") as f:
-                f.write(pem_data)
+            output_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
         elif format == "der":
             der_data = CertificateParser.to_der(cert)
             with open(output_path, "wb") as f:
@@ -263,41 +423,15 @@ class TruststoreManager:
             raise ValueError(f"Unsupported format: {self.format}")
 
     def _save_jks(self, path: Path, password: Optional[str]) -> bool:
-        """Save as JKS truststore using keytool."""
-        # JKS saving requires keytool - export each cert and import with keytool
-        if path.exists():
-            path.unlink()
-
+        """Save as JKS truststore."""
         pwd = password or "changeit"
 
-        for alias, entry in self.entries.items():
-            # Export to temp PEM file
-            temp_pem = Path(f"/tmp/{alias}.pem")
-            pem_data = CertificateParser.to_pem(entry.certificate)
-            with open(temp_pem, "w") as f:
-                f.write(pem_data)
-
-            # Import with keytool
-            cmd = [
-                "keytool",
-                "-importcert",
-                "-noprompt",
-                "-alias",
-                alias,
-                "-file",
-                str(temp_pem),
-                "-keystore",
-                str(path),
-                "-storetype",
-                "JKS",
-                "-storepass",
-                pwd,
-            ]
-
-            try:
-                subprocess.run(cmd, check=True, capture_output=True)
-            finally:
-                temp_pem.unlink()
+        jks_entries = [
+            jks.TrustedCertEntry.new(alias, entry.der)
+            for alias, entry in self.entries.items()
+        ]
+        keystore = jks.KeyStore.new("jks", jks_entries)
+        keystore.save(str(path), pwd)
 
         return True
 
@@ -326,12 +460,17 @@ class TruststoreManager:
         """Save as PEM directory."""
         if not path.exists():
             path.mkdir(parents=True)
+        if not self.entries:
+            return True
 
-        for alias, entry in self.entries.items():
-            pem_file = path / f"{alias}.crt"
-            pem_data = CertificateParser.to_pem(entry.certificate)
-            with open(pem_file, "w") as f:
-                f.write(pem_data)
+        def write_entry(entry: CertificateEntry) -> None:
+            pem_file = path / f"{entry.alias}.crt"
+            pem_file.write_bytes(entry.certificate.public_bytes(serialization.Encoding.PEM))
+
+        workers = min(MAX_PEM_WORKERS, len(self.entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results so write errors are raised here
+            list(executor.map(write_entry, self.entries.values()))
 
         return True
 
@@ -346,21 +485,25 @@ class TruststoreManager:
         Returns:
             Alias used for imported certificate
         """
-        # Detect format
-        if cert_path.suffix.lower() in [".pem", ".crt", ".cer"]:
-            with open(cert_path, "r") as f:
-                pem_data = f.read()
-            cert = CertificateParser.parse_pem(pem_data)
-        elif cert_path.suffix.lower() == ".der":
-            with open(cert_path, "rb") as f:
-                der_data = f.read()
-            cert = CertificateParser.parse_der(der_data)
-        else:
+        if cert_path.suffix.lower() not in (".pem", ".crt", ".cer", ".der"):
             raise ValueError(f"Unsupported certificate format: {cert_path.suffix}")
 
+        # Detect format from content: DER is an ASN.1 SEQUENCE, anything
+        # else is treated as PEM (.crt/.cer files come in both encodings)
+        cert_data = cert_path.read_bytes()
+        if cert_data[:1] == b"\x30":
+            cert = CertificateParser.parse_der(cert_data)
+        else:
+            cert = CertificateParser.parse_pem(cert_data)
+
         # Use provided alias or derive from file/cert
+        subject_cn = None
         if not alias:
-            alias = CertificateParser.get_subject_cn(cert) or cert_path.stem
+            subject_cn = CertificateParser.get_subject_cn(cert)
+            alias = subject_cn or cert_path.stem
 
         self.add_certificate(cert, alias, overwrite=True)
+        if subject_cn is not None:
+            # Already computed for the alias
+            self.entries[alias].subject_cn = subject_cn
         return alias
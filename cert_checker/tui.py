@@ -1,17 +1,47 @@
 """Text User Interface using Textual."""
 
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, DataTable, Footer, Header, Static, TabbedContent, TabPane
+from textual.widgets.data_table import ColumnKey
 from textual.reactive import reactive
+from textual.worker import get_current_worker
 
-from cert_checker.checker.remote import CertificateStatus, RemoteCertChecker
-from cert_checker.config import Config
+from cert_checker.checker.remote import CertificateStatus, HostCheckResult, RemoteCertChecker
+from cert_checker.config import Config, HostConfig
 from cert_checker.utils.cert_parser import CertificateParser
 
+# Seconds a host result is reused by Refresh ("Check Now" always re-checks)
+RESULT_TTL = 30
+
+_STATUS_ICONS = {
+    CertificateStatus.VALID: "✓",
+    CertificateStatus.WARNING: "⚠",
+    CertificateStatus.EXPIRED: "✗",
+}
+
+_DETAILS_TEMPLATE = (
+    "[bold]Host:[/bold] {host_name}\n"
+    "[bold]FQDN:[/bold] {fqdn}:{port}\n"
+    "\n"
+    "[bold]Subject CN:[/bold] {subject_cn}\n"
+    "[bold]Issuer CN:[/bold] {issuer_cn}\n"
+    "\n"
+    "[bold]Valid From:[/bold] {not_before:%Y-%m-%d %H:%M:%S UTC}\n"
+    "[bold]Valid Until:[/bold] {not_after:%Y-%m-%d %H:%M:%S UTC}\n"
+    "[bold]Days Remaining:[/bold] {days_remaining}\n"
+    "\n"
+    "{san_section}"
+    "{hostname_section}"
+    "[bold]Fingerprint (SHA-256):[/bold]\n"
+    "  {fingerprint}"
+)
+
 
 class CertCheckerApp(App):
     """TUI application for cert-checker."""
@@ -63,12 +93,22 @@ class CertCheckerApp(App):
     config: Optional[Config] = None
     selected_row: reactive[Optional[int]] = reactive(None)
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, config_cache: bool = False):
         """Initialize TUI app."""
         super().__init__()
         self.config_path = config_path
+        self.config_cache = config_cache
         self.checker = RemoteCertChecker()
         self.results = []
+        # Cells currently shown in the status table, keyed by row key
+        self._rows: Dict[str, Tuple[str, ...]] = {}
+        self._column_keys: List[ColumnKey] = []
+        # Formatted rows from the last refresh, keyed by the fields they show
+        self._row_cache: Dict[tuple, Tuple[str, ...]] = {}
+        # Rendered details by result index, cleared when results change
+        self._details_cache: Dict[int, str] = {}
+        # Last result and monotonic check time per host
+        self._host_results: Dict[tuple, Tuple[float, HostCheckResult]] = {}
 
     def compose(self) -> ComposeResult:
         """Compose TUI layout."""
@@ -90,136 +130,245 @@ class CertCheckerApp(App):
     def on_mount(self) -> None:
         """Initialize on mount."""
         table = self.query_one("#status_table", DataTable)
-        table.add_columns("Host", "FQDN:Port", "Status", "Expiry", "Days Left")
+        self._column_keys = table.add_columns(
+            "Host", "FQDN:Port", "Status", "Expiry", "Days Left"
+        )
         table.cursor_type = "row"
 
         # Load configuration if provided
         if self.config_path:
             try:
-                self.config = Config.from_file(self.config_path)
+                self.config = Config.from_file(self.config_path, use_cache=self.config_cache)
                 self.refresh_data()
             except Exception as e:
                 self.notify(f"Error loading config: {e}", severity="error")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "btn_refresh" or event.button.id == "btn_check":
+        if event.button.id == "btn_refresh":
             self.refresh_data()
+        elif event.button.id == "btn_check":
+            self.refresh_data(force=True)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection."""
-        self.selected_row = event.row_key.value
-        self.update_details()
-
-    def refresh_data(self) -> None:
-        """Refresh certificate data."""
+        if event.row_key.value is None:
+            return
+        self.selected_row = int(event.row_key.value)
+        if self._details_visible():
+            self.update_details()
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Render details when the Details tab is shown."""
+        if self._details_visible():
+            self.update_details()
+
+    def _details_visible(self) -> bool:
+        """Check whether the Details tab is active."""
+        return self.query_one(TabbedContent).active == "tab_details"
+
+    def refresh_data(self, force: bool = False) -> None:
+        """
+        Refresh certificate data.
+
+        Args:
+            force: Re-check every host, even results younger than RESULT_TTL
+        """
         if not self.config:
             self.notify("No configuration loaded", severity="warning")
             return
 
-        self.notify("Checking certificates...", severity="information")
+        hosts = self.config.get_enabled_hosts()
+        now = time.monotonic()
+        stale = [host for host in hosts if force or self._is_stale(host, now)]
+        if not stale:
+            self.notify("Results are up to date", severity="information")
+            return
+
+        self.notify(f"Checking {len(stale)} hosts...", severity="information")
+        self._check_hosts(hosts, stale, self.config.settings.timeout)
+
+    @staticmethod
+    def _host_key(host: HostConfig) -> tuple:
+        """Key identifying a host check (fields that affect its result)."""
+        return (host.name, host.fqdn, host.port, host.warning_days)
 
+    def _is_stale(self, host: HostConfig, now: float) -> bool:
+        """Check whether a host has no result younger than RESULT_TTL."""
+        cached = self._host_results.get(self._host_key(host))
+        return cached is None or now - cached[0] >= RESULT_TTL
+
+    @work(exclusive=True, thread=True)
+    def _check_hosts(self, hosts: List[HostConfig], stale: List[HostConfig], timeout: int) -> None:
+        """Check stale hosts in a worker thread so the UI stays responsive."""
         try:
-            self.results = self.checker.check_all_hosts(self.config)
-            self.update_table()
-            self.notify(f"Checked {len(self.results)} hosts", severity="information")
+            results = self.checker.check_hosts(stale, timeout)
         except Exception as e:
-            self.notify(f"Error checking hosts: {e}", severity="error")
+            self.call_from_thread(self.notify, f"Error checking hosts: {e}", severity="error")
+            return
+
+        # A newer refresh replaced this one
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(self._merge_results, hosts, stale, results, time.monotonic())
+
+    def _merge_results(
+        self,
+        hosts: List[HostConfig],
+        stale: List[HostConfig],
+        results: List[HostCheckResult],
+        checked_at: float,
+    ) -> None:
+        """Store fresh results and display all hosts, reusing recent results."""
+        for host, result in zip(stale, results):
+            self._host_results[self._host_key(host)] = (checked_at, result)
+        self._show_results(
+            [self._host_results[self._host_key(host)][1] for host in hosts], len(results)
+        )
+
+    def _show_results(self, results: List[HostCheckResult], checked: int) -> None:
+        """Display results of a finished check."""
+        self.results = results
+        self._details_cache = {}
+        self.update_table()
+        if self._details_visible():
+            self.update_details()
+        self.notify(f"Checked {checked} hosts", severity="information")
 
     def update_table(self) -> None:
-        """Update status table with results."""
+        """
+        Update status table with results.
+
+        Rows are keyed by result index. When the set of rows is unchanged
+        only cells whose text changed are updated; otherwise the table is
+        rebuilt.
+        """
         table = self.query_one("#status_table", DataTable)
-        table.clear()
 
+        rows: Dict[str, Tuple[str, ...]] = {}
+        row_cache: Dict[tuple, Tuple[str, ...]] = {}
         for i, result in enumerate(self.results):
-            status_class = f"status_{result.status.value}"
-
-            if result.error:
-                table.add_row(
-                    result.host_name,
-                    f"{result.fqdn}:{result.port}",
-                    f"✗ Error",
-                    "-",
-                    "-",
-                    key=str(i),
-                )
-            elif result.expiration:
-                icon = self._get_status_icon(result.status)
-                status_text = f"{icon} {result.status.value.title()}"
-
-                expiry_date = result.expiration.not_after.strftime("%Y-%m-%d")
-                days = result.expiration.days_remaining
-
-                if result.expiration.is_expired:
-                    days_text = f"-{abs(days)}"
-                else:
-                    days_text = str(days)
-
-                table.add_row(
-                    result.host_name,
-                    f"{result.fqdn}:{result.port}",
-                    status_text,
-                    expiry_date,
-                    days_text,
-                    key=str(i),
-                )
+            cache_key = (
+                result.host_name,
+                result.fqdn,
+                result.port,
+                result.status,
+                result.expiration,
+                result.error,
+            )
+            row = self._row_cache.get(cache_key)
+            if row is None:
+                row = self._format_row(result)
+                if row is None:
+                    continue
+            row_cache[cache_key] = row
+            rows[str(i)] = row
+        self._row_cache = row_cache
+
+        if list(rows) != list(self._rows):
+            table.clear()
+            for key, row in rows.items():
+                table.add_row(*row, key=key)
+        else:
+            for key, row in rows.items():
+                for column_key, old_value, value in zip(self._column_keys, self._rows[key], row):
+                    if value != old_value:
+                        table.update_cell(key, column_key, value)
+
+        self._rows = rows
+
+    def _format_row(self, result: HostCheckResult) -> Optional[Tuple[str, ...]]:
+        """Format table cells for a result (None if there is nothing to show)."""
+        if result.error:
+            return (result.host_name, result.address, "✗ Error", "-", "-")
+        if not result.expiration:
+            return None
+
+        icon = self._get_status_icon(result.status)
+        status_text = f"{icon} {result.status.label.title()}"
+
+        return (
+            result.host_name,
+            result.address,
+            status_text,
+            # Both are set whenever expiration is
+            result.expiry_date or "",
+            result.days_text or "",
+        )
 
     def update_details(self) -> None:
         """Update details panel with selected host info."""
         if self.selected_row is None or self.selected_row >= len(self.results):
             return
 
-        result = self.results[self.selected_row]
         details = self.query_one("#details", Static)
+        content = self._details_cache.get(self.selected_row)
+        if content is None:
+            result = self.results[self.selected_row]
+            if result.certificate is not None and not result.error:
+                # Show everything but the fingerprint now; hash in a worker
+                content = self._render_details(result, "[dim]Computing...[/dim]")
+                self._compute_fingerprint(self.selected_row, result)
+            else:
+                content = self._render_details(result)
+                self._details_cache[self.selected_row] = content
 
+        details.update(content)
+
+    @work(exclusive=True, thread=True, group="fingerprint")
+    def _compute_fingerprint(self, row: int, result: HostCheckResult) -> None:
+        """Compute the certificate fingerprint and complete the details panel."""
+        if result.certificate is None:
+            return
+        fingerprint = CertificateParser.get_fingerprint(result.certificate)
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._show_fingerprint, row, result, fingerprint)
+
+    def _show_fingerprint(self, row: int, result: HostCheckResult, fingerprint: str) -> None:
+        """Cache full details for a row and show them if it is still selected."""
+        # Results were refreshed while the worker ran
+        if row >= len(self.results) or self.results[row] is not result:
+            return
+        content = self._render_details(result, fingerprint)
+        self._details_cache[row] = content
+        if self.selected_row == row:
+            self.query_one("#details", Static).update(content)
+
+    def _render_details(self, result: HostCheckResult, fingerprint: str = "") -> str:
+        """Render details panel content for a result."""
         if result.error:
-            content = f"[bold red]Error:[/bold red] {result.error}"
-        elif result.certificate and result.expiration:
-            subject_cn = CertificateParser.get_subject_cn(result.certificate)
-            issuer_cn = CertificateParser.get_issuer_cn(result.certificate)
-            san_list = CertificateParser.get_san(result.certificate)
-            fingerprint = CertificateParser.get_fingerprint(result.certificate)
-
-            lines = [
-                f"[bold]Host:[/bold] {result.host_name}",
-                f"[bold]FQDN:[/bold] {result.fqdn}:{result.port}",
-                "",
-                f"[bold]Subject CN:[/bold] {subject_cn}",
-                f"[bold]Issuer CN:[/bold] {issuer_cn}",
-                "",
-                f"[bold]Valid From:[/bold] {result.expiration.not_before.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                f"[bold]Valid Until:[/bold] {result.expiration.not_after.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                f"[bold]Days Remaining:[/bold] {result.expiration.days_remaining}",
-                "",
-            ]
-
-            if san_list:
-                lines.append(f"[bold]SAN:[/bold] {', '.join(san_list)}")
-                lines.append("")
-
-            if result.hostname_valid is not None:
-                hostname_status = "✓ Valid" if result.hostname_valid else "✗ Invalid"
-                lines.append(f"[bold]Hostname Match:[/bold] {hostname_status}")
-
-            lines.append(f"[bold]Fingerprint (SHA-256):[/bold]")
-            lines.append(f"  {fingerprint}")
-
-            content = "\n".join(lines)
+            return f"[bold red]Error:[/bold red] {result.error}"
+        if not (result.certificate and result.expiration):
+            return "No certificate data available"
+
+        cert = result.certificate
+        san_list = CertificateParser.get_san(cert)
+        san_section = f"[bold]SAN:[/bold] {', '.join(san_list)}\n\n" if san_list else ""
+        if result.hostname_valid is None:
+            hostname_section = ""
         else:
-            content = "No certificate data available"
-
-        details.update(content)
+            hostname_status = "✓ Valid" if result.hostname_valid else "✗ Invalid"
+            hostname_section = f"[bold]Hostname Match:[/bold] {hostname_status}\n"
+
+        return _DETAILS_TEMPLATE.format_map(
+            {
+                "host_name": result.host_name,
+                "fqdn": result.fqdn,
+                "port": result.port,
+                "subject_cn": CertificateParser.get_subject_cn(cert),
+                "issuer_cn": CertificateParser.get_issuer_cn(cert),
+                "not_before": result.expiration.not_before,
+                "not_after": result.expiration.not_after,
+                "days_remaining": result.expiration.days_remaining,
+                "san_section": san_section,
+                "hostname_section": hostname_section,
+                "fingerprint": fingerprint,
+            }
+        )
 
     def _get_status_icon(self, status: CertificateStatus) -> str:
         """Get status icon."""
-        if status == CertificateStatus.VALID:
-            return "✓"
-        elif status == CertificateStatus.WARNING:
-            return "⚠"
-        elif status == CertificateStatus.EXPIRED:
-            return "✗"
-        else:
-            return "✗"
+        return _STATUS_ICONS.get(status, "✗")
 
     def action_refresh(self) -> None:
         """Refresh action."""
@@ -1,14 +1,158 @@
 """Certificate parsing and information extraction utilities."""
 
 import hashlib
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from cryptography import x509
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.x509.oid import ExtensionOID, NameOID
 
+# DER tags and encoded OIDs used by the quick parser
+_TAG_SEQUENCE = 0x30
+_TAG_OID = 0x06
+_TAG_OCTET_STRING = 0x04
+_TAG_UTC_TIME = 0x17
+_TAG_VERSION = 0xA0
+_TAG_EXTENSIONS = 0xA3
+_TAG_DNS_NAME = 0x82
+_TAG_BMP_STRING = 0x1E
+_TAG_UNIVERSAL_STRING = 0x1C
+_OID_COMMON_NAME = b"\x55\x04\x03"
+_OID_SUBJECT_ALT_NAME = b"\x55\x1d\x11"
+
+# cryptography OIDs used by the extension and name lookups
+_CN = NameOID.COMMON_NAME
+_SAN = ExtensionOID.SUBJECT_ALTERNATIVE_NAME
+_BASIC_CONSTRAINTS = ExtensionOID.BASIC_CONSTRAINTS
+_KEY_USAGE = ExtensionOID.KEY_USAGE
+_EXTENDED_KEY_USAGE = ExtensionOID.EXTENDED_KEY_USAGE
+
+# Supported fingerprint algorithms
+_HASHERS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_pem_cached(pem_data: bytes) -> x509.Certificate:
+    """Parse PEM certificate, reusing the result for identical bytes."""
+    return x509.load_pem_x509_certificate(pem_data)
+
+
+@lru_cache(maxsize=512)
+def _parse_der_cached(der_data: bytes) -> x509.Certificate:
+    """Parse DER certificate, reusing the result for identical bytes."""
+    return x509.load_der_x509_certificate(der_data)
+
+
+@lru_cache(maxsize=1024)
+def _cert_der(cert: x509.Certificate) -> bytes:
+    """DER encoding of a certificate, cached per certificate."""
+    return cert.public_bytes(serialization.Encoding.DER)
+
+
+@lru_cache(maxsize=1024)
+def _ext_map(cert: x509.Certificate) -> Dict[x509.ObjectIdentifier, x509.ExtensionType]:
+    """Extension values by OID, built once per certificate."""
+    return {ext.oid: ext.value for ext in cert.extensions}
+
+
+class CertificateSummary(NamedTuple):
+    """Inventory fields of a certificate."""
+
+    subject_cn: Optional[str]
+    san: List[str]
+    not_before: datetime
+    not_after: datetime
+
+
+def _der_read(data: bytes, pos: int) -> Tuple[int, int, int]:
+    """Read DER header at pos; returns (tag, content start, content end)."""
+    tag = data[pos]
+    length = data[pos + 1]
+    pos += 2
+    if length & 0x80:
+        num_bytes = length & 0x7F
+        length = int.from_bytes(data[pos : pos + num_bytes], "big")
+        pos += num_bytes
+    end = pos + length
+    if end > len(data):
+        raise ValueError("Truncated DER data")
+    return tag, pos, end
+
+
+def _der_children(data: bytes, start: int, end: int) -> List[Tuple[int, int, int]]:
+    """List (tag, content start, content end) of the elements in a constructed value."""
+    children = []
+    while start < end:
+        tag, content_start, content_end = _der_read(data, start)
+        children.append((tag, content_start, content_end))
+        start = content_end
+    return children
+
+
+def _der_tbs_fields(data: bytes) -> List[Tuple[int, int, int]]:
+    """List TBSCertificate fields of a DER certificate, without the version."""
+    _, cert_start, _ = _der_read(data, 0)
+    _, tbs_start, tbs_end = _der_read(data, cert_start)
+    fields = _der_children(data, tbs_start, tbs_end)
+    if fields[0][0] == _TAG_VERSION:
+        fields = fields[1:]
+    # serialNumber, signature, issuer, validity, subject, subjectPublicKeyInfo, ...
+    return fields
+
+
+def _der_time(tag: int, value: bytes) -> datetime:
+    """Decode UTCTime/GeneralizedTime."""
+    text = value.decode("ascii").rstrip("Z")
+    if tag == _TAG_UTC_TIME:
+        # RFC 5280: two-digit years 50-99 are 19xx
+        text = ("19" if int(text[:2]) >= 50 else "20") + text
+    return datetime.strptime(text[:14], "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+
+
+def _der_string(tag: int, value: bytes) -> str:
+    """Decode an ASN.1 directory string."""
+    if tag == _TAG_BMP_STRING:
+        return value.decode("utf-16-be")
+    if tag == _TAG_UNIVERSAL_STRING:
+        return value.decode("utf-32-be")
+    return value.decode("utf-8", errors="replace")
+
+
+def _der_name_cn(data: bytes, start: int, end: int) -> Optional[str]:
+    """Get first Common Name from a DER Name."""
+    for _, rdn_start, rdn_end in _der_children(data, start, end):
+        for _, atv_start, atv_end in _der_children(data, rdn_start, rdn_end):
+            (_, oid_start, oid_end), (value_tag, value_start, value_end) = _der_children(
+                data, atv_start, atv_end
+            )[:2]
+            if data[oid_start:oid_end] == _OID_COMMON_NAME:
+                return _der_string(value_tag, data[value_start:value_end])
+    return None
+
+
+def _der_san(data: bytes, start: int, end: int) -> List[str]:
+    """Get DNS names from a DER SubjectAltName extension value."""
+    for tag, ext_start, ext_end in _der_children(data, start, end):
+        if tag != _TAG_SEQUENCE:
+            continue
+        fields = _der_children(data, ext_start, ext_end)
+        oid = fields[0]
+        value = fields[-1]
+        if data[oid[1] : oid[2]] == _OID_SUBJECT_ALT_NAME and value[0] == _TAG_OCTET_STRING:
+            _, names_start, names_end = _der_read(data, value[1])
+            return [
+                data[name_start:name_end].decode("ascii", errors="replace")
+                for name_tag, name_start, name_end in _der_children(data, names_start, names_end)
+                if name_tag == _TAG_DNS_NAME
+            ]
+    return []
+
 
 class CertificateParser:
     """Parse and extract information from X.509 certificates."""
@@ -18,12 +162,59 @@ class CertificateParser:
         """Parse PEM-encoded certificate."""
         if isinstance(pem_data, str):
             pem_data = pem_data.encode("utf-8")
-        return x509.load_pem_x509_certificate(pem_data, default_backend())
+        return _parse_pem_cached(pem_data)
+
+    @staticmethod
+    def parse_pem_many(pem_data: Union[str, bytes]) -> List[x509.Certificate]:
+        """Parse all certificates from PEM data (one or more blocks)."""
+        if isinstance(pem_data, str):
+            pem_data = pem_data.encode("utf-8")
+        return x509.load_pem_x509_certificates(pem_data)
 
     @staticmethod
     def parse_der(der_data: bytes) -> x509.Certificate:
         """Parse DER-encoded certificate."""
-        return x509.load_der_x509_certificate(der_data, default_backend())
+        return _parse_der_cached(der_data)
+
+    @staticmethod
+    def parse_der_many(der_list: Iterable[bytes]) -> List[x509.Certificate]:
+        """Parse a batch of DER-encoded certificates."""
+        load_der = x509.load_der_x509_certificate
+        return [load_der(der_data) for der_data in der_list]
+
+    @staticmethod
+    def parse_der_quick(der_data: bytes) -> CertificateSummary:
+        """
+        Extract subject CN, SAN DNS names and validity from DER without a full parse.
+
+        Walks the DER structure directly and skips keys, signatures and all
+        other extensions; meant for inventory scans.
+
+        Raises:
+            ValueError: Malformed certificate
+        """
+        try:
+            fields = _der_tbs_fields(der_data)
+            _, validity_start, validity_end = fields[3]
+            (nb_tag, nb_start, nb_end), (na_tag, na_start, na_end) = _der_children(
+                der_data, validity_start, validity_end
+            )
+            subject_cn = _der_name_cn(der_data, fields[4][1], fields[4][2])
+
+            san: List[str] = []
+            for tag, start, end in fields[6:]:
+                if tag == _TAG_EXTENSIONS:
+                    _, exts_start, exts_end = _der_read(der_data, start)
+                    san = _der_san(der_data, exts_start, exts_end)
+        except (IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Malformed DER certificate: {e}")
+
+        return CertificateSummary(
+            subject_cn=subject_cn,
+            san=san,
+            not_before=_der_time(nb_tag, der_data[nb_start:nb_end]),
+            not_after=_der_time(na_tag, der_data[na_start:na_end]),
+        )
 
     @staticmethod
     def parse(cert_data: Union[str, bytes], format: str = "pem") -> x509.Certificate:
@@ -46,7 +237,7 @@ class CertificateParser:
     def get_subject_cn(cert: x509.Certificate) -> Optional[str]:
         """Get Common Name from subject."""
         try:
-            cn_list = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+            cn_list = cert.subject.get_attributes_for_oid(_CN)
             if cn_list:
                 return cn_list[0].value
         except Exception:
@@ -62,7 +253,7 @@ class CertificateParser:
     def get_issuer_cn(cert: x509.Certificate) -> Optional[str]:
         """Get Common Name from issuer."""
         try:
-            cn_list = cert.issuer.get_attributes_for_oid(NameOID.COMMON_NAME)
+            cn_list = cert.issuer.get_attributes_for_oid(_CN)
             if cn_list:
                 return cn_list[0].value
         except Exception:
@@ -72,14 +263,10 @@ class CertificateParser:
     @staticmethod
     def get_san(cert: x509.Certificate) -> List[str]:
         """Get Subject Alternative Names."""
-        try:
-            san_ext = cert.extensions.get_extension_for_oid(
-                ExtensionOID.SUBJECT_ALTERNATIVE_NAME
-            )
-            san_list = san_ext.value.get_values_for_type(x509.DNSName)
-            return list(san_list)
-        except x509.ExtensionNotFound:
+        san = _ext_map(cert).get(_SAN)
+        if san is None:
             return []
+        return list(san.get_values_for_type(x509.DNSName))
 
     @staticmethod
     def get_validity_period(cert: x509.Certificate) -> Tuple[datetime, datetime]:
@@ -91,19 +278,24 @@ class CertificateParser:
         cert: x509.Certificate, algorithm: str = "sha256"
     ) -> str:
         """Get certificate fingerprint."""
-        cert_bytes = cert.public_bytes(serialization.Encoding.DER)
-
-        if algorithm.lower() == "sha256":
-            digest = hashlib.sha256(cert_bytes).hexdigest()
-        elif algorithm.lower() == "sha1":
-            digest = hashlib.sha1(cert_bytes).hexdigest()
-        elif algorithm.lower() == "md5":
-            digest = hashlib.md5(cert_bytes).hexdigest()
-        else:
+        hasher = _HASHERS.get(algorithm.lower())
+        if hasher is None:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
         # Format as colon-separated pairs
-        return ":".join(digest[i : i + 2] for i in range(0, len(digest), 2)).upper()
+        return hasher(_cert_der(cert)).digest().hex(":").upper()
+
+    @staticmethod
+    def get_fingerprints(
+        certs: Iterable[x509.Certificate], algorithm: str = "sha256"
+    ) -> List[str]:
+        """Get fingerprints for a batch of certificates (same format as get_fingerprint)."""
+        hasher = _HASHERS.get(algorithm.lower())
+        if hasher is None:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+        # One-shot digest over each DER buffer
+        return [hasher(_cert_der(cert)).digest().hex(":").upper() for cert in certs]
 
     @staticmethod
     def get_public_key_info(cert: x509.Certificate) -> Dict[str, Union[str, int]]:
@@ -126,7 +318,7 @@ class CertificateParser:
     @staticmethod
     def get_serial_number(cert: x509.Certificate) -> str:
         """Get certificate serial number as hex string."""
-        return format(cert.serial_number, "X")
+        return f"{cert.serial_number:X}"
 
     @staticmethod
     def get_version(cert: x509.Certificate) -> int:
@@ -140,48 +332,39 @@ class CertificateParser:
 
     @staticmethod
     def is_self_signed(cert: x509.Certificate) -> bool:
-        """Check if certificate is self-signed."""
-        return cert.subject == cert.issuer
+        """Check if certificate is self-signed (issuer and subject encode identically)."""
+        return cert.subject.public_bytes() == cert.issuer.public_bytes()
 
     @staticmethod
     def is_ca(cert: x509.Certificate) -> bool:
         """Check if certificate is a CA certificate."""
-        try:
-            basic_constraints = cert.extensions.get_extension_for_oid(
-                ExtensionOID.BASIC_CONSTRAINTS
-            )
-            return basic_constraints.value.ca
-        except x509.ExtensionNotFound:
-            return False
+        basic_constraints = _ext_map(cert).get(_BASIC_CONSTRAINTS)
+        return basic_constraints.ca if basic_constraints is not None else False
 
     @staticmethod
     def get_key_usage(cert: x509.Certificate) -> List[str]:
         """Get key usage extensions."""
-        try:
-            key_usage = cert.extensions.get_extension_for_oid(ExtensionOID.KEY_USAGE)
-            usages = []
-            if key_usage.value.digital_signature:
-                usages.append("digital_signature")
-            if key_usage.value.key_encipherment:
-                usages.append("key_encipherment")
-            if key_usage.value.key_cert_sign:
-                usages.append("key_cert_sign")
-            if key_usage.value.crl_sign:
-                usages.append("crl_sign")
-            return usages
-        except x509.ExtensionNotFound:
+        key_usage = _ext_map(cert).get(_KEY_USAGE)
+        if key_usage is None:
             return []
+        usages = []
+        if key_usage.digital_signature:
+            usages.append("digital_signature")
+        if key_usage.key_encipherment:
+            usages.append("key_encipherment")
+        if key_usage.key_cert_sign:
+            usages.append("key_cert_sign")
+        if key_usage.crl_sign:
+            usages.append("crl_sign")
+        return usages
 
     @staticmethod
     def get_extended_key_usage(cert: x509.Certificate) -> List[str]:
         """Get extended key usage extensions."""
-        try:
-            ext_key_usage = cert.extensions.get_extension_for_oid(
-                ExtensionOID.EXTENDED_KEY_USAGE
-            )
-            return [oid._name for oid in ext_key_usage.value]
-        except x509.ExtensionNotFound:
+        ext_key_usage = _ext_map(cert).get(_EXTENDED_KEY_USAGE)
+        if ext_key_usage is None:
             return []
+        return [oid._name for oid in ext_key_usage]
 
     @staticmethod
     def to_pem(cert: x509.Certificate) -> str:
@@ -191,12 +374,13 @@ class CertificateParser:
     @staticmethod
     def to_der(cert: x509.Certificate) -> bytes:
         """Convert certificate to DER format."""
-        return cert.public_bytes(serialization.Encoding.DER)
+        return _cert_der(cert)
 
     @staticmethod
     def get_all_info(cert: x509.Certificate) -> Dict:
         """Get all certificate information as dictionary."""
         not_before, not_after = CertificateParser.get_validity_period(cert)
+        der = _cert_der(cert)
 
         return {
             "version": CertificateParser.get_version(cert),
@@ -208,8 +392,8 @@ class CertificateParser:
             "not_before": not_before.isoformat(),
             "not_after": not_after.isoformat(),
             "san": CertificateParser.get_san(cert),
-            "fingerprint_sha256": CertificateParser.get_fingerprint(cert, "sha256"),
-            "fingerprint_sha1": CertificateParser.get_fingerprint(cert, "sha1"),
+            "fingerprint_sha256": hashlib.sha256(der).digest().hex(":").upper(),
+            "fingerprint_sha1": hashlib.sha1(der).digest().hex(":").upper(),
             "public_key": CertificateParser.get_public_key_info(cert),
             "signature_algorithm": CertificateParser.get_signature_algorithm(cert),
             "is_self_signed": CertificateParser.is_self_signed(cert),
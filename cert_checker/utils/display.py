@@ -1,50 +1,179 @@
 """Display and formatting utilities using Rich."""
 
-import json
-from datetime import datetime
-from typing import List, Optional
+import csv
+import io
+import operator
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from cryptography import x509
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
-from rich import box
 
 from cert_checker.checker.remote import CertificateStatus, HostCheckResult
 from cert_checker.store.truststore import CertificateEntry
 from cert_checker.store.keystore import KeyEntry
 from cert_checker.utils.cert_parser import CertificateParser
 
+# Rich (and json) are imported by the methods that use them, so machine-readable
+# output does not pay for loading the rendering modules.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+# Full timestamp format for detail views
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+def _format_date(dt: datetime) -> str:
+    """Format a date as YYYY-MM-DD (same as strftime("%Y-%m-%d"), without strftime)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+# CSV export columns
+CSV_HEADER = [
+    "Host", "FQDN", "Port", "Status", "Subject", "Issuer", "Expiry", "Days Remaining", "Error"
+]
+
+# Summary table fields of a result, read in one call per row
+_summary_fields = operator.attrgetter("host_name", "address", "status", "error", "expiration")
+
+# Certificates whose display fields are kept by a formatter before the cache is reset
+CERT_CACHE_SIZE = 1024
+
 
 class DisplayFormatter:
     """Format output using Rich library."""
 
-    def __init__(self, console: Optional[Console] = None):
+    # Status presentation (anything else is shown as an error)
+    _STATUS_STYLE = {
+        CertificateStatus.VALID: "bold green",
+        CertificateStatus.WARNING: "bold yellow",
+        CertificateStatus.EXPIRED: "bold red",
+    }
+    _STATUS_BORDER = {
+        CertificateStatus.VALID: "green",
+        CertificateStatus.WARNING: "yellow",
+        CertificateStatus.EXPIRED: "red",
+    }
+    _STATUS_ICON = {
+        CertificateStatus.VALID: "✓",
+        CertificateStatus.WARNING: "⚠",
+        CertificateStatus.EXPIRED: "✗",
+    }
+
+    # Hostname line of a result panel by hostname_valid
+    _HOSTNAME_LINE = {
+        None: "",
+        True: "\n[bold]Hostname:[/bold] [green]✓ Valid[/green]",
+        False: "\n[bold]Hostname:[/bold] [red]✗ Invalid[/red]",
+    }
+
+    # Table columns as (header, add_column options)
+    _SUMMARY_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+        ("Host", {"style": "cyan", "no_wrap": True}),
+        ("FQDN:Port", {"style": "white"}),
+        ("Status", {"justify": "center"}),
+        ("Expiry", {"justify": "center"}),
+        ("Days Left", {"justify": "right"}),
+    )
+    _TRUSTSTORE_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+        ("Alias", {"style": "cyan"}),
+        ("Subject CN", {"style": "white"}),
+        ("Issuer CN", {"style": "white"}),
+        ("Valid Until", {"justify": "center"}),
+        ("Type", {"justify": "center"}),
+    )
+    _KEYSTORE_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+        ("Alias", {"style": "cyan"}),
+        ("Subject CN", {"style": "white"}),
+        ("Valid Until", {"justify": "center"}),
+        ("Chain Length", {"justify": "center"}),
+        ("Has Key", {"justify": "center"}),
+    )
+    _FINGERPRINT_COLUMN: Tuple[str, Dict[str, Any]] = ("SHA-256 Fingerprint", {"style": "dim"})
+
+    # Console shared by formatters created without one (probes the terminal once)
+    _default_console: Optional["Console"] = None
+
+    def __init__(self, console: Optional["Console"] = None):
         """Initialize formatter with console."""
-        self.console = console or Console()
+        if console is None:
+            console = self._get_default_console()
+        self.console = console
+        # Display fields per certificate (certificates hash by content)
+        self._cert_cache: Dict[x509.Certificate, Dict[str, Any]] = {}
+
+    @classmethod
+    def _get_default_console(cls) -> "Console":
+        """Get the shared default console, creating it on first use."""
+        if cls._default_console is None:
+            from rich.console import Console
+
+            cls._default_console = Console()
+        return cls._default_console
+
+    def _info(self, cert: x509.Certificate) -> Dict[str, Any]:
+        """Get display fields of a certificate, computed once per certificate."""
+        info = self._cert_cache.get(cert)
+        if info is None:
+            if len(self._cert_cache) >= CERT_CACHE_SIZE:
+                self._cert_cache.clear()
+            not_before, not_after = CertificateParser.get_validity_period(cert)
+            info = {
+                "subject_cn": CertificateParser.get_subject_cn(cert),
+                "issuer_cn": CertificateParser.get_issuer_cn(cert),
+                "not_before": not_before,
+                "not_after": not_after,
+            }
+            self._cert_cache[cert] = info
+        return info
+
+    def _fingerprint(self, cert: x509.Certificate) -> str:
+        """Get SHA-256 fingerprint of a certificate, computed once per certificate."""
+        info = self._info(cert)
+        fingerprint = info.get("fingerprint")
+        if fingerprint is None:
+            fingerprint = info["fingerprint"] = CertificateParser.get_fingerprint(cert)
+        return fingerprint
+
+    def _fingerprints(self, certs: Sequence[x509.Certificate]) -> List[str]:
+        """Get SHA-256 fingerprints of certificates, hashing the uncached ones in one batch."""
+        infos = [self._info(cert) for cert in certs]
+        missing = [i for i, info in enumerate(infos) if "fingerprint" not in info]
+        if missing:
+            computed = CertificateParser.get_fingerprints(certs[i] for i in missing)
+            for i, fingerprint in zip(missing, computed):
+                infos[i]["fingerprint"] = fingerprint
+        return [info["fingerprint"] for info in infos]
+
+    @staticmethod
+    def _new_table(title: str, columns: Sequence[Tuple[str, Dict[str, Any]]]) -> "Table":
+        """Create a rounded table with the given columns."""
+        from rich import box
+        from rich.table import Table
+
+        table = Table(title=title, box=box.ROUNDED)
+        for header, options in columns:
+            table.add_column(header, **options)
+        return table
 
     def _get_status_style(self, status: CertificateStatus) -> str:
         """Get Rich style for status."""
-        if status == CertificateStatus.VALID:
-            return "bold green"
-        elif status == CertificateStatus.WARNING:
-            return "bold yellow"
-        elif status == CertificateStatus.EXPIRED:
-            return "bold red"
-        else:
-            return "bold red"
+        return self._STATUS_STYLE.get(status, "bold red")
 
     def _get_status_icon(self, status: CertificateStatus) -> str:
         """Get icon for status."""
-        if status == CertificateStatus.VALID:
-            return "✓"
-        elif status == CertificateStatus.WARNING:
-            return "⚠"
-        elif status == CertificateStatus.EXPIRED:
-            return "✗"
-        else:
-            return "✗"
+        return self._STATUS_ICON.get(status, "✗")
 
     def format_check_result(self, result: HostCheckResult, verbose: bool = False) -> None:
         """
@@ -54,7 +183,8 @@ class DisplayFormatter:
             result: Host check result
             verbose: Show detailed information
         """
-        status_style = self._get_status_style(result.status)
+        from rich.panel import Panel
+
         icon = self._get_status_icon(result.status)
 
         # Create title
@@ -64,52 +194,47 @@ class DisplayFormatter:
         if result.error:
             content = f"[bold red]Error:[/bold red] {result.error}"
             panel = Panel(content, title=title, border_style="red")
-        else:
-            content_lines = []
-
-            if result.certificate and result.expiration:
-                content_lines.append(
-                    f"[bold]Subject:[/bold] {CertificateParser.get_subject_cn(result.certificate)}"
-                )
-                content_lines.append(
-                    f"[bold]Issuer:[/bold] {CertificateParser.get_issuer_cn(result.certificate)}"
-                )
-                content_lines.append(
-                    f"[bold]Valid Until:[/bold] {result.expiration.not_after.strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                )
-
-                days_style = "green" if result.expiration.days_remaining > 30 else "yellow"
-                if result.expiration.is_expired:
-                    days_style = "red"
-                    days_text = f"{abs(result.expiration.days_remaining)} days ago"
-                else:
-                    days_text = f"{result.expiration.days_remaining} days"
-
-                content_lines.append(
-                    f"[bold]Days Remaining:[/bold] [{days_style}]{days_text}[/{days_style}]"
-                )
-
-                if result.hostname_valid is not None:
-                    hostname_status = "✓ Valid" if result.hostname_valid else "✗ Invalid"
-                    hostname_style = "green" if result.hostname_valid else "red"
-                    content_lines.append(
-                        f"[bold]Hostname:[/bold] [{hostname_style}]{hostname_status}[/{hostname_style}]"
-                    )
-
-                if verbose and result.certificate:
-                    san_list = CertificateParser.get_san(result.certificate)
-                    if san_list:
-                        content_lines.append(f"[bold]SAN:[/bold] {', '.join(san_list)}")
-
-                    fingerprint = CertificateParser.get_fingerprint(result.certificate)
-                    content_lines.append(f"[bold]Fingerprint:[/bold] {fingerprint}")
+        elif result.certificate and result.expiration:
+            info = self._info(result.certificate)
+            expiration = result.expiration
+
+            # Set whenever expiration is
+            days_text = result.days_text or ""
+            if expiration.is_expired:
+                days_style = "red"
+                # Drop the leading minus sign
+                days_text = f"{days_text[1:]} days ago"
+            else:
+                days_style = "green" if expiration.days_remaining > 30 else "yellow"
+                days_text = f"{days_text} days"
+
+            content = (
+                f"[bold]Subject:[/bold] {info['subject_cn']}\n"
+                f"[bold]Issuer:[/bold] {info['issuer_cn']}\n"
+                f"[bold]Valid Until:[/bold] {expiration.not_after.strftime(DATETIME_FORMAT)}\n"
+                f"[bold]Days Remaining:[/bold] [{days_style}]{days_text}[/{days_style}]"
+                f"{self._HOSTNAME_LINE[result.hostname_valid]}"
+            )
 
-            content = "\n".join(content_lines)
-            panel = Panel(content, title=title, border_style=status_style.split()[1])
+            if verbose:
+                extra_lines = []
+                san_list = CertificateParser.get_san(result.certificate)
+                if san_list:
+                    extra_lines.append(f"[bold]SAN:[/bold] {', '.join(san_list)}")
+                fingerprint = self._fingerprint(result.certificate)
+                extra_lines.append(f"[bold]Fingerprint:[/bold] {fingerprint}")
+                content += "\n" + "\n".join(extra_lines)
+
+            border_style = self._STATUS_BORDER.get(result.status, "red")
+            panel = Panel(content, title=title, border_style=border_style)
+        else:
+            content = ""
+            border_style = self._STATUS_BORDER.get(result.status, "red")
+            panel = Panel(content, title=title, border_style=border_style)
 
         self.console.print(panel)
 
-    def create_summary_table(self, results: List[HostCheckResult]) -> Table:
+    def create_summary_table(self, results: List[HostCheckResult]) -> "Table":
         """
         Create summary table of host check results.
 
@@ -119,45 +244,48 @@ class DisplayFormatter:
         Returns:
             Rich Table
         """
-        table = Table(title="Certificate Check Summary", box=box.ROUNDED)
+        from rich.text import Text
 
-        table.add_column("Host", style="cyan", no_wrap=True)
-        table.add_column("FQDN:Port", style="white")
-        table.add_column("Status", justify="center")
-        table.add_column("Expiry", justify="center")
-        table.add_column("Days Left", justify="right")
+        table = self._new_table("Certificate Check Summary", self._SUMMARY_COLUMNS)
 
-        for result in results:
-            icon = self._get_status_icon(result.status)
-            status_style = self._get_status_style(result.status)
+        # Styled cells skip markup parsing; status cells are shared by rows
+        status_cells: Dict[Tuple[CertificateStatus, bool], Text] = {}
+        add_row = table.add_row
 
-            if result.error:
-                table.add_row(
-                    result.host_name,
-                    f"{result.fqdn}:{result.port}",
-                    f"[{status_style}]{icon} Error[/{status_style}]",
-                    "-",
-                    "-",
-                )
-            elif result.expiration:
-                expiry_date = result.expiration.not_after.strftime("%Y-%m-%d")
-                days = result.expiration.days_remaining
-
-                if result.expiration.is_expired:
-                    days_text = f"[red]-{abs(days)}[/red]"
-                elif result.expiration.is_warning:
-                    days_text = f"[yellow]{days}[/yellow]"
-                else:
-                    days_text = f"[green]{days}[/green]"
-
-                table.add_row(
-                    result.host_name,
-                    f"{result.fqdn}:{result.port}",
-                    f"[{status_style}]{icon} {result.status.value.title()}[/{status_style}]",
-                    expiry_date,
-                    days_text,
+        for result in results:
+            host_name, address, status, error, expiration = _summary_fields(result)
+            is_error = bool(error)
+            if not is_error and not expiration:
+                continue
+
+            cell_key = (status, is_error)
+            status_cell = status_cells.get(cell_key)
+            if status_cell is None:
+                label = "Error" if is_error else status.label.title()
+                status_cell = status_cells[cell_key] = Text(
+                    f"{self._get_status_icon(status)} {label}",
+                    style=self._get_status_style(status),
                 )
 
+            if is_error:
+                add_row(host_name, address, status_cell, "-", "-")
+                continue
+
+            if expiration.is_expired:
+                days_style = "red"
+            elif expiration.is_warning:
+                days_style = "yellow"
+            else:
+                days_style = "green"
+
+            add_row(
+                host_name,
+                address,
+                status_cell,
+                result.expiry_date,
+                Text(result.days_text or "", style=days_style),
+            )
+
         return table
 
     def print_summary_table(self, results: List[HostCheckResult]) -> None:
@@ -165,6 +293,29 @@ class DisplayFormatter:
         table = self.create_summary_table(results)
         self.console.print(table)
 
+    def print_check_results(self, results: List[HostCheckResult], verbose: bool = False) -> None:
+        """
+        Print results of a check run with a single write.
+
+        One result is shown as a panel; several as a summary table,
+        followed by a panel per host when verbose.
+
+        Args:
+            results: List of host check results
+            verbose: Show detailed information
+        """
+        # Rich buffers everything printed inside the context and writes it on exit
+        with self.console:
+            if len(results) == 1:
+                self.format_check_result(results[0], verbose=verbose)
+                return
+
+            self.print_summary_table(results)
+            if verbose:
+                self.console.print()
+                for result in results:
+                    self.format_check_result(result, verbose=True)
+
     def format_certificate(self, cert: x509.Certificate, verbose: bool = False) -> None:
         """
         Format and print certificate details.
@@ -173,24 +324,12 @@ class DisplayFormatter:
             cert: Certificate to display
             verbose: Show detailed information
         """
-        info = CertificateParser.get_all_info(cert)
-
-        tree = Tree(f"[bold cyan]Certificate Details[/bold cyan]")
-
-        tree.add(f"[bold]Subject:[/bold] {info['subject_cn'] or info['subject']}")
-        tree.add(f"[bold]Issuer:[/bold] {info['issuer_cn'] or info['issuer']}")
-
-        validity = tree.add("[bold]Validity[/bold]")
-        validity.add(f"Not Before: {info['not_before']}")
-        validity.add(f"Not After: {info['not_after']}")
+        from rich.tree import Tree
 
-        if info['san']:
-            san_node = tree.add(f"[bold]Subject Alternative Names ({len(info['san'])})[/bold]")
-            for san in info['san']:
-                san_node.add(san)
+        info = CertificateParser.get_all_info(cert)
 
-        tree.add(f"[bold]Serial Number:[/bold] {info['serial_number']}")
-        tree.add(f"[bold]Signature Algorithm:[/bold] {info['signature_algorithm']}")
+        tree = Tree("[bold cyan]Certificate Details[/bold cyan]")
+        add = tree.add
 
         pub_key = info['public_key']
         key_info = f"{pub_key['type']}"
@@ -198,28 +337,54 @@ class DisplayFormatter:
             key_info += f" ({pub_key['size']} bits)"
         if 'curve' in pub_key:
             key_info += f" ({pub_key['curve']})"
-        tree.add(f"[bold]Public Key:[/bold] {key_info}")
+
+        add(f"[bold]Subject:[/bold] {info['subject_cn'] or info['subject']}")
+        add(f"[bold]Issuer:[/bold] {info['issuer_cn'] or info['issuer']}")
+
+        validity = add("[bold]Validity[/bold]")
+        validity.add(f"Not Before: {info['not_before']}")
+        validity.add(f"Not After: {info['not_after']}")
+
+        if info['san']:
+            self._add_leaves(
+                add(f"[bold]Subject Alternative Names ({len(info['san'])})[/bold]"), info['san']
+            )
+
+        for label, value in (
+            ("Serial Number", info['serial_number']),
+            ("Signature Algorithm", info['signature_algorithm']),
+            ("Public Key", key_info),
+        ):
+            add(f"[bold]{label}:[/bold] {value}")
 
         if verbose:
-            tree.add(f"[bold]Version:[/bold] {info['version']}")
-            tree.add(f"[bold]Self-Signed:[/bold] {info['is_self_signed']}")
-            tree.add(f"[bold]Is CA:[/bold] {info['is_ca']}")
+            for label, value in (
+                ("Version", info['version']),
+                ("Self-Signed", info['is_self_signed']),
+                ("Is CA", info['is_ca']),
+            ):
+                add(f"[bold]{label}:[/bold] {value}")
 
             if info['key_usage']:
-                ku_node = tree.add("[bold]Key Usage[/bold]")
-                for usage in info['key_usage']:
-                    ku_node.add(usage)
+                self._add_leaves(add("[bold]Key Usage[/bold]"), info['key_usage'])
 
             if info['extended_key_usage']:
-                eku_node = tree.add("[bold]Extended Key Usage[/bold]")
-                for usage in info['extended_key_usage']:
-                    eku_node.add(usage)
+                self._add_leaves(add("[bold]Extended Key Usage[/bold]"), info['extended_key_usage'])
 
-            tree.add(f"[bold]SHA-256 Fingerprint:[/bold] {info['fingerprint_sha256']}")
-            tree.add(f"[bold]SHA-1 Fingerprint:[/bold] {info['fingerprint_sha1']}")
+            add(f"[bold]SHA-256 Fingerprint:[/bold] {info['fingerprint_sha256']}")
+            add(f"[bold]SHA-1 Fingerprint:[/bold] {info['fingerprint_sha1']}")
 
         self.console.print(tree)
 
+    @staticmethod
+    def _add_leaves(node: Any, values: Sequence[str]) -> None:
+        """Add plain-text leaves to a tree node (values are not parsed as markup)."""
+        from rich.text import Text
+
+        add = node.add
+        for value in values:
+            add(Text(value))
+
     def format_chain(self, chain: List[x509.Certificate]) -> None:
         """
         Format and print certificate chain.
@@ -227,146 +392,214 @@ class DisplayFormatter:
         Args:
             chain: Certificate chain (leaf first)
         """
+        from rich.tree import Tree
+
         tree = Tree("[bold cyan]Certificate Chain[/bold cyan]")
 
         for i, cert in enumerate(chain):
             level = "Leaf" if i == 0 else f"Intermediate {i}" if i < len(chain) - 1 else "Root"
-            cn = CertificateParser.get_subject_cn(cert) or "Unknown"
+            info = self._info(cert)
+            cn = info["subject_cn"] or "Unknown"
             node = tree.add(f"[bold]{level}:[/bold] {cn}")
 
-            issuer_cn = CertificateParser.get_issuer_cn(cert)
-            node.add(f"Issued by: {issuer_cn}")
-
-            not_before, not_after = CertificateParser.get_validity_period(cert)
-            node.add(f"Valid until: {not_after.strftime('%Y-%m-%d')}")
+            node.add(f"Issued by: {info['issuer_cn']}")
+            node.add(f"Valid until: {_format_date(info['not_after'])}")
 
         self.console.print(tree)
 
-    def create_truststore_table(self, entries: List[CertificateEntry]) -> Table:
+    def create_truststore_table(
+        self, entries: Sequence[CertificateEntry], fingerprints: bool = False
+    ) -> "Table":
         """
         Create table of truststore entries.
 
         Args:
             entries: List of certificate entries
+            fingerprints: Add a SHA-256 fingerprint column
 
         Returns:
             Rich Table
         """
-        table = Table(title="Truststore Certificates", box=box.ROUNDED)
-
-        table.add_column("Alias", style="cyan")
-        table.add_column("Subject CN", style="white")
-        table.add_column("Issuer CN", style="white")
-        table.add_column("Valid Until", justify="center")
-        table.add_column("Type", justify="center")
-
-        for entry in entries:
-            subject_cn = CertificateParser.get_subject_cn(entry.certificate) or "N/A"
-            issuer_cn = CertificateParser.get_issuer_cn(entry.certificate) or "N/A"
-            not_before, not_after = CertificateParser.get_validity_period(entry.certificate)
-
-            # Check if expired
-            now = datetime.now(not_after.tzinfo)
-            is_expired = now > not_after
-            expiry_style = "red" if is_expired else "green"
-            expiry_text = f"[{expiry_style}]{not_after.strftime('%Y-%m-%d')}[/{expiry_style}]"
+        from rich.text import Text
+
+        columns = self._TRUSTSTORE_COLUMNS
+        if fingerprints:
+            columns += (self._FINGERPRINT_COLUMN,)
+        table = self._new_table("Truststore Certificates", columns)
+        if fingerprints:
+            fingerprint_list = self._fingerprints([entry.certificate for entry in entries])
+
+        # Validity dates are timezone-aware UTC
+        now = datetime.now(timezone.utc)
+        info_of = self._info
+        add_row = table.add_row
+        for i, entry in enumerate(entries):
+            info = info_of(entry.certificate)
+            subject_cn = entry.subject_cn or "N/A"
+            issuer_cn = info["issuer_cn"] or "N/A"
+            not_after = info["not_after"]
+
+            expiry_style = "red" if now > not_after else "green"
+            expiry_text = Text(_format_date(not_after), style=expiry_style)
 
             cert_type = "CA" if CertificateParser.is_ca(entry.certificate) else "Cert"
 
-            table.add_row(entry.alias, subject_cn, issuer_cn, expiry_text, cert_type)
+            row: List[Union[str, Text]] = [
+                entry.alias,
+                subject_cn,
+                issuer_cn,
+                expiry_text,
+                cert_type,
+            ]
+            if fingerprints:
+                row.append(fingerprint_list[i])
+            add_row(*row)
 
         return table
 
-    def print_truststore_table(self, entries: List[CertificateEntry]) -> None:
+    def print_truststore_table(
+        self, entries: Sequence[CertificateEntry], fingerprints: bool = False
+    ) -> None:
         """Print truststore table."""
-        table = self.create_truststore_table(entries)
+        table = self.create_truststore_table(entries, fingerprints=fingerprints)
         self.console.print(table)
 
-    def create_keystore_table(self, entries: List[KeyEntry]) -> Table:
+    def create_keystore_table(
+        self, entries: Sequence[KeyEntry], fingerprints: bool = False
+    ) -> "Table":
         """
         Create table of keystore entries.
 
         Args:
             entries: List of key entries
+            fingerprints: Add a SHA-256 fingerprint column
 
         Returns:
             Rich Table
         """
-        table = Table(title="Keystore Entries", box=box.ROUNDED)
+        from rich.text import Text
+
+        columns = self._KEYSTORE_COLUMNS
+        if fingerprints:
+            columns += (self._FINGERPRINT_COLUMN,)
+        table = self._new_table("Keystore Entries", columns)
+        if fingerprints:
+            fingerprint_list = self._fingerprints([entry.certificate for entry in entries])
 
-        table.add_column("Alias", style="cyan")
-        table.add_column("Subject CN", style="white")
-        table.add_column("Valid Until", justify="center")
-        table.add_column("Chain Length", justify="center")
-        table.add_column("Has Key", justify="center")
+        key_cells = {True: Text("✓", style="green"), False: Text("✗", style="red")}
 
-        for entry in entries:
-            subject_cn = CertificateParser.get_subject_cn(entry.certificate) or "N/A"
-            not_before, not_after = CertificateParser.get_validity_period(entry.certificate)
+        # Validity dates are timezone-aware UTC
+        now = datetime.now(timezone.utc)
+        info_of = self._info
+        add_row = table.add_row
+        for i, entry in enumerate(entries):
+            subject_cn = entry.subject_cn or "N/A"
+            not_after = info_of(entry.certificate)["not_after"]
 
-            # Check if expired
-            now = datetime.now(not_after.tzinfo)
-            is_expired = now > not_after
-            expiry_style = "red" if is_expired else "green"
-            expiry_text = f"[{expiry_style}]{not_after.strftime('%Y-%m-%d')}[/{expiry_style}]"
+            expiry_style = "red" if now > not_after else "green"
+            expiry_text = Text(_format_date(not_after), style=expiry_style)
 
             chain_len = len(entry.certificate_chain)
-            has_key = "✓" if entry.has_private_key else "✗"
-            key_style = "green" if entry.has_private_key else "red"
 
-            table.add_row(
+            row: List[Union[str, Text]] = [
                 entry.alias,
                 subject_cn,
                 expiry_text,
                 str(chain_len),
-                f"[{key_style}]{has_key}[/{key_style}]",
-            )
+                key_cells[bool(entry.has_private_key)],
+            ]
+            if fingerprints:
+                row.append(fingerprint_list[i])
+            add_row(*row)
 
         return table
 
-    def print_keystore_table(self, entries: List[KeyEntry]) -> None:
+    def print_keystore_table(
+        self, entries: Sequence[KeyEntry], fingerprints: bool = False
+    ) -> None:
         """Print keystore table."""
-        table = self.create_keystore_table(entries)
+        table = self.create_keystore_table(entries, fingerprints=fingerprints)
         self.console.print(table)
 
-    def export_json(self, results: List[HostCheckResult]) -> str:
+    def export_json(self, results: List[HostCheckResult], indent: Optional[int] = 2) -> str:
         """
         Export results to JSON.
 
         Args:
             results: List of host check results
+            indent: Indentation (None for compact output, which is faster)
 
         Returns:
             JSON string
         """
-        data = []
-        for result in results:
-            entry = {
-                "host_name": result.host_name,
-                "fqdn": result.fqdn,
-                "port": result.port,
-                "status": result.status.value,
-            }
+        return "".join(self.iter_export_json(results, indent=indent))
 
-            if result.error:
-                entry["error"] = result.error
-            elif result.certificate and result.expiration:
-                entry["certificate"] = {
-                    "subject_cn": CertificateParser.get_subject_cn(result.certificate),
-                    "issuer_cn": CertificateParser.get_issuer_cn(result.certificate),
-                    "not_before": result.expiration.not_before.isoformat(),
-                    "not_after": result.expiration.not_after.isoformat(),
-                    "days_remaining": result.expiration.days_remaining,
-                    "is_expired": result.expiration.is_expired,
-                    "fingerprint": CertificateParser.get_fingerprint(result.certificate),
-                }
+    def iter_export_json(
+        self, results: Iterable[HostCheckResult], indent: Optional[int] = 2
+    ) -> Iterator[str]:
+        """
+        Export results to JSON one entry at a time.
 
-                if result.hostname_valid is not None:
-                    entry["hostname_valid"] = result.hostname_valid
+        Entries are encoded as they are consumed; the joined chunks match
+        json.dumps of the whole list.
 
-            data.append(entry)
+        Args:
+            results: Host check results
+            indent: Indentation (None for compact output, which is faster)
+
+        Yields:
+            JSON text chunks
+        """
+        import json
 
-        return json.dumps(data, indent=2)
+        if indent is None:
+            pad = ""
+            start, separator, end = "[", ", ", "]"
+        else:
+            pad = "\n" + " " * indent
+            start, separator, end = "[" + pad, "," + pad, "\n]"
+
+        dumps = json.dumps
+        json_entry = self._json_entry
+        empty = True
+        for result in results:
+            text = dumps(json_entry(result), indent=indent)
+            # Nest the entry one level (JSON strings never contain raw newlines)
+            yield (start if empty else separator) + (text.replace("\n", pad) if pad else text)
+            empty = False
+
+        # An empty list has no padding
+        yield "[]" if empty else end
+
+    def _json_entry(self, result: HostCheckResult) -> Dict[str, Any]:
+        """Build the JSON export entry for a result."""
+        entry: Dict[str, Any] = {
+            "host_name": result.host_name,
+            "fqdn": result.fqdn,
+            "port": result.port,
+            "status": result.status.label,
+        }
+
+        if result.error:
+            entry["error"] = result.error
+        elif result.certificate and result.expiration:
+            cert = result.certificate
+            expiration = result.expiration
+            info = self._info(cert)
+            entry["certificate"] = {
+                "subject_cn": info["subject_cn"],
+                "issuer_cn": info["issuer_cn"],
+                "not_before": expiration.not_before.isoformat(),
+                "not_after": expiration.not_after.isoformat(),
+                "days_remaining": expiration.days_remaining,
+                "is_expired": expiration.is_expired,
+                "fingerprint": self._fingerprint(cert),
+            }
+
+            if result.hostname_valid is not None:
+                entry["hostname_valid"] = result.hostname_valid
+
+        return entry
 
     def export_csv(self, results: List[HostCheckResult]) -> str:
         """
@@ -378,24 +611,58 @@ class DisplayFormatter:
         Returns:
             CSV string
         """
-        lines = ["Host,FQDN,Port,Status,Subject,Issuer,Expiry,Days Remaining,Error"]
+        # No trailing newline, as before
+        return "".join(self.iter_export_csv(results)).rstrip("\n")
 
+    def iter_export_csv(self, results: Iterable[HostCheckResult]) -> Iterator[str]:
+        """
+        Export results to CSV one line at a time.
+
+        Args:
+            results: Host check results
+
+        Yields:
+            CSV lines (header first), each ending with a newline
+        """
+        buf = io.StringIO()
+        writerow = csv.writer(buf, lineterminator="\n").writerow
+        info_of = self._info
+
+        def line(row: List[Any]) -> str:
+            writerow(row)
+            text = buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            return text
+
+        yield line(CSV_HEADER)
         for result in results:
             if result.error:
-                lines.append(
-                    f"{result.host_name},{result.fqdn},{result.port},"
-                    f"{result.status.value},,,,{result.error}"
+                yield line(
+                    [
+                        result.host_name,
+                        result.fqdn,
+                        result.port,
+                        result.status.label,
+                        "",
+                        "",
+                        "",
+                        "",
+                        result.error,
+                    ]
                 )
             elif result.certificate and result.expiration:
-                subject_cn = CertificateParser.get_subject_cn(result.certificate) or ""
-                issuer_cn = CertificateParser.get_issuer_cn(result.certificate) or ""
-                expiry = result.expiration.not_after.strftime("%Y-%m-%d")
-                days = result.expiration.days_remaining
-
-                lines.append(
-                    f"{result.host_name},{result.fqdn},{result.port},"
-                    f"{result.status.value},{subject_cn},{issuer_cn},"
-                    f"{expiry},{days},"
+                info = info_of(result.certificate)
+                yield line(
+                    [
+                        result.host_name,
+                        result.fqdn,
+                        result.port,
+                        result.status.label,
+                        info["subject_cn"] or "",
+                        info["issuer_cn"] or "",
+                        result.expiry_date,
+                        result.expiration.days_remaining,
+                        "",
+                    ]
                 )
-
-        return "\n".join(lines)